@@ -46,7 +46,7 @@ try:
     qlik_cli = QlikCLI(config)
     logger.info("QlikCLI initialized successfully")
 except QlikCLIError as e:
-    logger.error(f"Failed to initialize QlikCLI: {e}")
+    logger.error("Failed to initialize QlikCLI: %s", e)
     sys.exit(1)
 
 
@@ -84,6 +84,7 @@ class QlikAppExportParams(BaseModel):
     format: str = Field(default="qvf", description="Export format: 'qvf', 'json', or 'xlsx'")
     include_data: bool = Field(default=True, description="Whether to include data in export")
     no_data: bool = Field(default=False, description="Export without data (only metadata/script)")
+    verify_exists: bool = Field(default=True, description="Look the app up before exporting (can be disabled for bulk exports)")
 
 
 class QlikAppImportParams(BaseModel):
@@ -93,6 +94,7 @@ class QlikAppImportParams(BaseModel):
     space_id: Optional[str] = Field(None, description="Target space for import (optional, uses personal space if not provided)")
     replace_existing: bool = Field(default=False, description="Whether to replace existing app with same name")
     validate_before_import: bool = Field(default=True, description="Whether to validate file before import")
+    verify: bool = Field(default=True, description="Whether to look the imported app up afterwards if the import output does not describe it")
 
 
 class QlikAppCopyParams(BaseModel):
@@ -132,6 +134,7 @@ class QlikAppSearchParams(BaseModel):
     limit: int = Field(20, description="Maximum number of search results to return (default: 20)")
     space_id: Optional[str] = Field(None, description="Filter results by specific space ID")
     owner: Optional[str] = Field(None, description="Filter results by app owner name")
+    mode: str = Field("substring", description="Match mode: 'substring' (name, description and tags) or 'prefix' (app names starting with the query)")
 
 
 class QlikSpaceListParams(BaseModel):
@@ -144,6 +147,7 @@ class QlikContextCreateParams(BaseModel):
     name: str = Field(description="Name for the new context")
     tenant_url: str = Field(description="Qlik Cloud tenant URL (e.g., https://your-tenant.qlikcloud.com)")
     api_key: str = Field(description="API key for authentication with Qlik Cloud")
+    validate_api_key: bool = Field(default=False, description="Whether to validate the API key against the tenant before creating the context")
 
 
 class QlikContextUseParams(BaseModel):
@@ -178,7 +182,7 @@ def qlik_app_export(params: QlikAppExportParams) -> Dict[str, Any]:
     Raises:
         Exception: If the export operation fails
     """
-    logger.info(f"Exporting Qlik app '{params.app_identifier}' to '{params.output_path}'")
+    logger.info("Exporting Qlik app '%s' to '%s'", params.app_identifier, params.output_path)
     
     try:
         # Execute the app export
@@ -187,7 +191,8 @@ def qlik_app_export(params: QlikAppExportParams) -> Dict[str, Any]:
             output_path=params.output_path,
             format=params.format,
             include_data=params.include_data,
-            no_data=params.no_data
+            no_data=params.no_data,
+            verify_exists=params.verify_exists
         )
         
         # Format the output for better readability
@@ -200,7 +205,7 @@ def qlik_app_export(params: QlikAppExportParams) -> Dict[str, Any]:
             'export_duration': f"{result['export_duration_seconds']} seconds"
         }
         
-        logger.info(f"Successfully exported app '{params.app_identifier}' ({result['file_size_mb']} MB)")
+        logger.info("Successfully exported app '%s' (%s MB)", params.app_identifier, result['file_size_mb'])
         
         return {
             "success": True,
@@ -244,7 +249,7 @@ def qlik_app_import(params: QlikAppImportParams) -> Dict[str, Any]:
     Raises:
         Exception: If the import operation fails
     """
-    logger.info(f"Importing Qlik app from '{params.file_path}' with name '{params.app_name}'")
+    logger.info("Importing Qlik app from '%s' with name '%s'", params.file_path, params.app_name)
     
     try:
         # Execute the app import
@@ -253,7 +258,8 @@ def qlik_app_import(params: QlikAppImportParams) -> Dict[str, Any]:
             app_name=params.app_name,
             space_id=params.space_id,
             replace_existing=params.replace_existing,
-            validate_before_import=params.validate_before_import
+            validate_before_import=params.validate_before_import,
+            verify=params.verify
         )
         
         # Format the output for better readability
@@ -278,7 +284,7 @@ def qlik_app_import(params: QlikAppImportParams) -> Dict[str, Any]:
                 f"App has data: {'Yes' if app_details['has_data'] else 'No'}"
             ]
         
-        logger.info(f"Successfully imported app '{result['app_name']}' (ID: {result['new_app_id']})")
+        logger.info("Successfully imported app '%s' (ID: %s)", result['app_name'], result['new_app_id'])
         
         return {
             "success": True,
@@ -324,7 +330,7 @@ def qlik_app_copy(params: QlikAppCopyParams) -> Dict[str, Any]:
     Raises:
         Exception: If the copy operation fails
     """
-    logger.info(f"Copying Qlik app '{params.source_app_id}' to new app '{params.target_name}'")
+    logger.info("Copying Qlik app '%s' to new app '%s'", params.source_app_id, params.target_name)
     
     try:
         # Execute the app copy
@@ -364,7 +370,7 @@ def qlik_app_copy(params: QlikAppCopyParams) -> Dict[str, Any]:
                 f"Copy has data: {'Yes' if app_details['has_data'] else 'No'}"
             ]
         
-        logger.info(f"Successfully copied app '{params.source_app_id}' to '{result['target_name']}' (ID: {result['new_app_id']})")
+        logger.info("Successfully copied app '%s' to '%s' (ID: %s)", params.source_app_id, result['target_name'], result['new_app_id'])
         
         return {
             "success": True,
@@ -410,7 +416,7 @@ def qlik_app_publish(params: QlikAppPublishParams) -> Dict[str, Any]:
     Raises:
         Exception: If the publication operation fails
     """
-    logger.info(f"Publishing Qlik app '{params.app_id}' to managed space '{params.target_space_id}'")
+    logger.info("Publishing Qlik app '%s' to managed space '%s'", params.app_id, params.target_space_id)
     
     try:
         # Execute the app publication
@@ -451,7 +457,7 @@ def qlik_app_publish(params: QlikAppPublishParams) -> Dict[str, Any]:
                 f"App is now accessible to space members"
             ]
         
-        logger.info(f"Successfully published app '{params.app_id}' to space '{result['target_space_name']}' (Published ID: {result['published_app_id']})")
+        logger.info("Successfully published app '%s' to space '%s' (Published ID: %s)", params.app_id, result['target_space_name'], result['published_app_id'])
         
         return {
             "success": True,
@@ -499,7 +505,7 @@ def qlik_app_list(params: QlikAppListParams) -> Dict[str, Any]:
     Raises:
         Exception: If the app listing operation fails
     """
-    logger.info(f"Listing Qlik apps with filters: space_id={params.space_id}, owner={params.owner}")
+    logger.info("Listing Qlik apps with filters: space_id=%s, owner=%s", params.space_id, params.owner)
     
     try:
         # Execute the app listing
@@ -537,7 +543,7 @@ def qlik_app_list(params: QlikAppListParams) -> Dict[str, Any]:
             }
             formatted_apps.append(formatted_app)
         
-        logger.info(f"Successfully listed {len(apps)} Qlik apps")
+        logger.info("Successfully listed %s Qlik apps", len(apps))
         
         return {
             "success": True,
@@ -581,7 +587,7 @@ def qlik_app_get(params: QlikAppGetParams) -> Dict[str, Any]:
     Raises:
         Exception: If the app retrieval operation fails or app doesn't exist
     """
-    logger.info(f"Getting details for Qlik app: {params.app_identifier}")
+    logger.info("Getting details for Qlik app: %s", params.app_identifier)
     
     try:
         # Execute the app details retrieval
@@ -633,7 +639,7 @@ def qlik_app_get(params: QlikAppGetParams) -> Dict[str, Any]:
                 'target_app_id': app['target_app_id'] or 'None'
             }
         
-        logger.info(f"Successfully retrieved details for app: {params.app_identifier}")
+        logger.info("Successfully retrieved details for app: %s", params.app_identifier)
         
         return {
             "success": True,
@@ -671,7 +677,7 @@ def qlik_app_search(params: QlikAppSearchParams) -> Dict[str, Any]:
     Raises:
         Exception: If the search operation fails
     """
-    logger.info(f"Searching Qlik apps with query: '{params.query}'")
+    logger.info("Searching Qlik apps with query: '%s'", params.query)
     
     try:
         # Build filters dictionary
@@ -685,7 +691,8 @@ def qlik_app_search(params: QlikAppSearchParams) -> Dict[str, Any]:
         result = qlik_cli.app_search(
             query=params.query,
             limit=params.limit,
-            filters=filters if filters else None
+            filters=filters if filters else None,
+            mode=params.mode
         )
         
         apps = result['apps']
@@ -715,7 +722,7 @@ def qlik_app_search(params: QlikAppSearchParams) -> Dict[str, Any]:
             'top_match': apps[0]['name'] if apps else 'No matches found'
         }
         
-        logger.info(f"Found {len(apps)} matching apps for query: '{params.query}'")
+        logger.info("Found %s matching apps for query: '%s'", len(apps), params.query)
         
         return {
             "success": True,
@@ -754,7 +761,7 @@ def qlik_space_list(params: QlikSpaceListParams) -> Dict[str, Any]:
     Raises:
         Exception: If the space listing operation fails
     """
-    logger.info(f"Listing Qlik spaces with type filter: {params.type_filter}")
+    logger.info("Listing Qlik spaces with type filter: %s", params.type_filter)
     
     try:
         # Execute the space listing
@@ -789,7 +796,7 @@ def qlik_space_list(params: QlikSpaceListParams) -> Dict[str, Any]:
             'total_apps_across_spaces': sum(s['app_count'] for s in spaces if s['app_count'] >= 0)
         }
         
-        logger.info(f"Successfully listed {len(spaces)} Qlik spaces")
+        logger.info("Successfully listed %s Qlik spaces", len(spaces))
         
         return {
             "success": True,
@@ -830,7 +837,7 @@ def qlik_app_build(params: QlikAppBuildParams) -> Dict[str, Any]:
     Raises:
         Exception: If the build operation fails
     """
-    logger.info(f"Starting qlik app build for app: {params.app}")
+    logger.info("Starting qlik app build for app: %s", params.app)
     
     try:
         # Convert Pydantic model to dict for QlikCLI
@@ -839,7 +846,7 @@ def qlik_app_build(params: QlikAppBuildParams) -> Dict[str, Any]:
         # Execute the build command
         result = qlik_cli.app_build(**build_params)
         
-        logger.info(f"Successfully built Qlik app: {params.app}")
+        logger.info("Successfully built Qlik app: %s", params.app)
         
         return {
             "success": True,
@@ -879,7 +886,7 @@ def qlik_app_unbuild(params: QlikAppUnbuildParams) -> Dict[str, Any]:
     Raises:
         Exception: If the unbuild operation fails
     """
-    logger.info(f"Starting qlik app unbuild for app: {params.app}")
+    logger.info("Starting qlik app unbuild for app: %s", params.app)
     
     try:
         # Convert Pydantic model to dict for QlikCLI
@@ -912,7 +919,7 @@ def qlik_app_unbuild(params: QlikAppUnbuildParams) -> Dict[str, Any]:
             ]
         }
         
-        logger.info(f"Successfully completed unbuild for app: {params.app}")
+        logger.info("Successfully completed unbuild for app: %s", params.app)
         
         return response
         
@@ -936,7 +943,8 @@ def qlik_context_create(params: QlikContextCreateParams) -> Dict[str, Any]:
     
     This tool creates a new authentication context for Qlik Cloud, allowing users
     to securely store and manage API keys for different tenants or environments.
-    The API key is validated against the tenant before the context is created.
+    The API key can optionally be validated against the tenant before the context
+    is created.
     
     Args:
         params: QlikContextCreateParams containing context name, tenant URL, and API key
@@ -947,13 +955,16 @@ def qlik_context_create(params: QlikContextCreateParams) -> Dict[str, Any]:
     Raises:
         Exception: If context creation fails or API key validation fails
     """
-    logger.info(f"Creating Qlik context: {params.name}")
+    logger.info("Creating Qlik context: %s", params.name)
     
     try:
         # Execute the context creation
-        result = qlik_cli.context_create(params.name, params.tenant_url, params.api_key)
+        result = qlik_cli.context_create(
+            params.name, params.tenant_url, params.api_key,
+            validate=params.validate_api_key
+        )
         
-        logger.info(f"Successfully created Qlik context: {params.name}")
+        logger.info("Successfully created Qlik context: %s", params.name)
         
         return {
             "success": True,
@@ -995,7 +1006,7 @@ def qlik_context_list() -> Dict[str, Any]:
         # Execute the context listing
         result = qlik_cli.context_list()
         
-        logger.info(f"Successfully listed Qlik contexts: {len(result['contexts'])} found")
+        logger.info("Successfully listed Qlik contexts: %s found", len(result['contexts']))
         
         return {
             "success": True,
@@ -1034,13 +1045,13 @@ def qlik_context_use(params: QlikContextUseParams) -> Dict[str, Any]:
     Raises:
         Exception: If context switching fails or context doesn't exist
     """
-    logger.info(f"Switching to Qlik context: {params.name}")
+    logger.info("Switching to Qlik context: %s", params.name)
     
     try:
         # Execute the context switch
         result = qlik_cli.context_use(params.name)
         
-        logger.info(f"Successfully switched to Qlik context: {params.name}")
+        logger.info("Successfully switched to Qlik context: %s", params.name)
         
         return {
             "success": True,
@@ -1079,13 +1090,13 @@ def qlik_context_remove(params: QlikContextRemoveParams) -> Dict[str, Any]:
     Raises:
         Exception: If context removal fails or context is currently active
     """
-    logger.info(f"Removing Qlik context: {params.name}")
+    logger.info("Removing Qlik context: %s", params.name)
     
     try:
         # Execute the context removal
         result = qlik_cli.context_remove(params.name)
         
-        logger.info(f"Successfully removed Qlik context: {params.name}")
+        logger.info("Successfully removed Qlik context: %s", params.name)
         
         return {
             "success": True,
@@ -1177,13 +1188,13 @@ def main():
     This function initializes and starts the MCP server, making the Qlik tools
     available to MCP clients. The server will run until interrupted.
     """
-    logger.info(f"Starting {config.server.name} v{config.server.version}")
-    logger.info(f"Debug mode: {config.server.debug}")
-    logger.info(f"Log level: {config.server.log_level}")
+    logger.info("Starting %s v%s", config.server.name, config.server.version)
+    logger.info("Debug mode: %s", config.server.debug)
+    logger.info("Log level: %s", config.server.log_level)
     
     # Log configuration information
     if hasattr(config.qlik, 'default_unbuild_directory') and config.qlik.default_unbuild_directory:
-        logger.info(f"Default unbuild directory configured: {config.qlik.default_unbuild_directory}")
+        logger.info("Default unbuild directory configured: %s", config.qlik.default_unbuild_directory)
     else:
         logger.info("No default unbuild directory configured - using qlik-cli defaults")
     
@@ -1227,10 +1238,11 @@ def main():
         logger.info("Server shutdown requested by user")
         
     except Exception as e:
-        logger.error(f"Server error: {str(e)}")
+        logger.error("Server error: %s", e)
         sys.exit(1)
         
     finally:
+        qlik_cli.close()
         logger.info("MCP server stopped")
 
 
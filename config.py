@@ -71,6 +71,18 @@ class QlikConfig(BaseModel):
         description="Timeout for qlik-cli commands in seconds"
     )
     
+    # Concurrency settings
+    max_parallel_commands: int = Field(
+        default=8,
+        description="Maximum number of qlik-cli commands run at the same time (fan-out operations included)"
+    )
+    
+    # Direct REST settings
+    rest_api_lookups: bool = Field(
+        default=False,
+        description="Call the Qlik Cloud REST API directly for app listings in direct mode (requires httpx)"
+    )
+    
     def validate_context_directory(self) -> bool:
         """
         Validate that context directory exists and is accessible
@@ -221,7 +233,9 @@ class Config(BaseModel):
             default_unbuild_directory=os.getenv('QLIK_DEFAULT_UNBUILD_DIRECTORY'),
             include_file_contents_in_output=os.getenv('QLIK_INCLUDE_FILE_CONTENTS', 'true').lower() == 'true',
             qvf_export_directory=os.getenv('QLIK_QVF_EXPORT_DIRECTORY', './exports'),
-            command_timeout=int(os.getenv('QLIK_COMMAND_TIMEOUT', '300'))
+            command_timeout=int(os.getenv('QLIK_COMMAND_TIMEOUT', '300')),
+            max_parallel_commands=int(os.getenv('QLIK_MAX_PARALLEL_COMMANDS', '8')),
+            rest_api_lookups=os.getenv('QLIK_REST_API_LOOKUPS', 'false').lower() == 'true'
         )
         
         server_config = ServerConfig(
@@ -5,27 +5,251 @@ This module provides the base QlikCLI class with core functionality,
 error handling, validation methods, and command execution infrastructure.
 """
 
+import asyncio
+import functools
+import hashlib
+import importlib
 import subprocess
 import json
+from json.decoder import WHITESPACE as _JSON_WHITESPACE
 import logging
 import os
-import re
 import shutil
+import stat
 import tempfile
+import threading
 import time
-from typing import Dict, List, Optional, Any, Union
-from pathlib import Path
-from urllib.parse import urlparse
+from typing import Callable, Dict, Iterable, List, Optional, Any, Tuple, Union
+from urllib.parse import quote, urlsplit
 
 from config import Config
 
+# orjson is optional; it parses large qlik-cli JSON dumps considerably faster.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers only
+# need to handle the latter.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Shared decoder for scanning concatenated/JSON-lines output
+_JSON_DECODER = json.JSONDecoder()
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Flags whose following argument must never appear in logs
+_SENSITIVE_FLAGS = frozenset({'--api-key', '--token', '--password', '--client-secret'})
+
+# Every Qlik Cloud tenant host (all regions) ends with this suffix
+_QLIK_CLOUD_HOST_SUFFIX = '.qlikcloud.com'
+
+# Successful API key validations are remembered for this long (seconds)
+_API_KEY_CACHE_TTL = 60
+
+# Failed API key validations are remembered for this long (seconds)
+_API_KEY_NEGATIVE_CACHE_TTL = 30
+
+# qlik-cli error output meaning the tenant rejected the credentials; other
+# failures (timeouts, network errors) are not remembered as invalid keys
+_AUTH_REJECTION_MARKERS = ('401', '403', 'unauthorized', 'forbidden', 'authentication',
+                           'invalid api key', 'invalid token')
+
+# Qlik Cloud API keys are JWTs: long, base64url segments joined by dots
+_API_KEY_MIN_LENGTH = 40
+_API_KEY_CHARS = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789._-')
+
+# Maximum number of remembered API key validations per QlikCLI instance
+_API_KEY_CACHE_SIZE = 256
+
+# How long a successful qlik-cli availability check is reused (seconds)
+_CLI_AVAILABLE_TTL = 300
+
+# How long the qlik-cli version is reused when the executable cannot be
+# stat'ed (otherwise it is kept until the binary's mtime changes)
+_CLI_VERSION_TTL = 300
+
+# How long a successful validate_connection result is reused (seconds)
+_CONNECTION_CHECK_TTL = 60
+
+# How long a context_list result is reused (seconds)
+_CONTEXT_LIST_TTL = 30
+
+# How long an app_list result is reused (seconds)
+_APP_LIST_TTL = 30
+
+# Formats qlik app export can write
+_VALID_EXPORT_FORMATS = frozenset({'qvf', 'json', 'xlsx'})
+
+# How long a file/directory validation result is reused (seconds); short, so
+# files created or removed by hand are noticed almost immediately
+_PATH_CHECK_TTL = 2
+_PATH_CHECK_CACHE_SIZE = 256
+
+# How long the free space of a file system is reused for export checks (seconds)
+_DISK_SPACE_TTL = 2
+
+# Spooled qlik-cli output (app export) larger than this is only kept
+# as its last _SPOOLED_OUTPUT_LIMIT bytes (where results and errors end up)
+_SPOOLED_OUTPUT_LIMIT = 1024 * 1024
+
+# Keep-alive connections held open to the tenant for direct REST lookups
+_REST_MAX_KEEPALIVE_CONNECTIONS = 16
+
+# How long user and space names looked up over REST are reused (seconds)
+_REST_NAME_TTL = 300
+
+
+@functools.lru_cache(maxsize=None)
+def _optional_import(module_name: str) -> Optional[Any]:
+    """
+    Import an optional module on first use
+    
+    Used for httpx (and h2 for HTTP/2), which are only needed for direct REST
+    lookups and are slow to import, so servers that never use them skip the cost.
+    
+    Returns:
+        The module, or None if it is not installed
+    """
+    try:
+        return importlib.import_module(module_name)
+    except ImportError:
+        return None
+
+
+# (kind, absolute path) -> (checked at, result), oldest first
+_path_check_cache: Dict[Tuple[str, str], Tuple[float, bool]] = {}
+
+
+def _cached_path_check(kind: str, path: str, check: Callable[[str], bool]) -> bool:
+    """
+    Run a file system check on path, reusing its result for _PATH_CHECK_TTL seconds
+    
+    Args:
+        kind: Name of the check, part of the cache key
+        path: Path to check (keyed by its absolute form)
+        check: Function performing the check
+        
+    Returns:
+        Result of check(path)
+    """
+    key = (kind, os.path.abspath(path))
+    now = time.monotonic()
+    hit = _path_check_cache.get(key)
+    if hit and now - hit[0] < _PATH_CHECK_TTL:
+        return hit[1]
+    result = check(path)
+    # Re-insert so the dictionary stays ordered by check time
+    _path_check_cache.pop(key, None)
+    _path_check_cache[key] = (now, result)
+    while len(_path_check_cache) > _PATH_CHECK_CACHE_SIZE:
+        try:
+            _path_check_cache.pop(next(iter(_path_check_cache)), None)
+        except (StopIteration, RuntimeError):
+            # Another thread changed the cache; it is trimmed on the next check
+            break
+    return result
+
+
+def _invalidate_path_cache(path: str) -> None:
+    """
+    Drop cached path checks for path, its ancestors and everything below it
+    
+    Called after creating directories or writing files, so the next
+    validation sees the change.
+    
+    Args:
+        path: File or directory path that changed
+    """
+    changed = os.path.abspath(path)
+    for key in list(_path_check_cache):
+        cached = key[1]
+        if (cached == changed or cached.startswith(changed + os.sep)
+                or changed.startswith(cached.rstrip(os.sep) + os.sep)):
+            _path_check_cache.pop(key, None)
+
+
+def _is_file(path: str) -> bool:
+    """Check that path is an existing regular file with a single stat"""
+    return os.path.isfile(path)
+
+
+def _is_directory_or_creatable(path: str) -> bool:
+    """Check that path is an existing directory, or missing under a writable parent"""
+    try:
+        # A single stat answers both "exists" and "is a directory"
+        return stat.S_ISDIR(os.stat(path).st_mode)
+    except (FileNotFoundError, NotADirectoryError):
+        # Check if parent directory exists and is writable (normpath first,
+        # so a trailing separator does not make the path its own parent)
+        return _parent_writable(os.path.dirname(os.path.normpath(path)) or '.')
+
+
+def _decode_output(output: Union[str, bytes, None]) -> str:
+    """Decode captured qlik-cli output to text (str input is returned as is)"""
+    if not output:
+        return ''
+    if isinstance(output, bytes):
+        return output.decode('utf-8', errors='replace')
+    return output
+
+
+def _read_spooled_output(spool: Any) -> bytes:
+    """
+    Read back qlik-cli output spooled to a temporary file
+    
+    Args:
+        spool: Binary temporary file the process wrote to
+        
+    Returns:
+        The output, or only its last _SPOOLED_OUTPUT_LIMIT bytes if it is larger
+    """
+    size = spool.seek(0, os.SEEK_END)
+    if size > _SPOOLED_OUTPUT_LIMIT:
+        logger.debug("Keeping the last %s of %s bytes of qlik-cli output", _SPOOLED_OUTPUT_LIMIT, size)
+        spool.seek(size - _SPOOLED_OUTPUT_LIMIT)
+    else:
+        spool.seek(0)
+    return spool.read()
+
+
+def _next_page_url(page: Dict[str, Any]) -> Optional[str]:
+    """Return the links.next.href cursor of a Qlik Cloud REST page, if any"""
+    return ((page.get('links') or {}).get('next') or {}).get('href')
+
+
+def _parent_writable(parent: str) -> bool:
+    """
+    Check whether a parent directory exists and is writable
+    
+    Not cached itself; directory validations that call it are cached by
+    _cached_path_check.
+    
+    Args:
+        parent: Parent directory path
+        
+    Returns:
+        True if parent is an existing, writable directory
+    """
+    return os.path.isdir(parent) and os.access(parent, os.W_OK)
+
 
 class QlikCLIError(Exception):
     """Custom exception for Qlik CLI related errors"""
-    pass
+    
+    def __init__(self, message: str, returncode: Optional[int] = None):
+        super().__init__(message)
+        # Exit code when qlik-cli ran and failed; None for timeouts and launch errors
+        self.returncode = returncode
+
+
+def _is_auth_rejection(error: QlikCLIError) -> bool:
+    """Check whether qlik-cli ran and reported that the credentials were rejected"""
+    if not error.returncode:
+        return False
+    message = str(error).lower()
+    return any(marker in message for marker in _AUTH_REJECTION_MARKERS)
 
 
 class QlikCLI:
@@ -38,6 +262,10 @@ class QlikCLI:
     and secure credential handling.
     """
     
+    # Short-lived memo of qlik-cli lookups: key -> (timestamp, value).
+    # Shared between instances since the CLI and its contexts are machine-wide.
+    _command_cache: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
+    
     def __init__(self, config: Config):
         """
         Initialize QlikCLI with configuration
@@ -49,17 +277,329 @@ class QlikCLI:
         self.cli_path = config.qlik.cli_path
         self.timeout = config.qlik.command_timeout
         
+        # Global flags never change for the lifetime of this instance
+        base_cmd = [self.cli_path]
+        if config.qlik.tenant_url:
+            base_cmd.extend(['--server', config.qlik.tenant_url])
+        if config.server.debug:
+            base_cmd.append('--verbose')
+        self._base_cmd_prefix = tuple(base_cmd)
+        
+        # Environment for qlik-cli processes; None inherits ours without copying it
+        self._env: Optional[Dict[str, str]] = None
+        
+        # Caps the qlik-cli processes run at once by _execute_command and
+        # _execute_command_async, also when fan-outs (space app counts,
+        # app_get_many, ...) overlap
+        self._process_slots = threading.BoundedSemaphore(max(1, config.qlik.max_parallel_commands))
+        
+        # Recently validated (sha256(api_key), tenant_url) pairs ->
+        # (validation time, valid). Raw API keys are never stored.
+        self._api_key_cache: Dict[Tuple[bytes, str], Tuple[float, bool]] = {}
+        self._api_key_cache_lock = threading.Lock()
+        
+        # Persistent HTTP client for direct REST lookups, created on first use
+        self._http_client = None
+        self._http_client_lock = threading.Lock()
+        
+        # Lookup indexes over the last (cached) listing they were built from,
+        # as (listing, index...) tuples; rebuilt when the listing object changes
+        self._context_index: Optional[Tuple[Any, ...]] = None
+        self._app_text_index: Optional[Tuple[Any, ...]] = None
+        self._app_name_index: Optional[Tuple[Any, ...]] = None
+        
         # Validate qlik-cli is available
         if not self._validate_cli_available():
             raise QlikCLIError(f"qlik-cli not found at path: {self.cli_path}")
     
+    def _cached(self, key: Tuple[Any, ...], ttl: float, fn: Callable[[], Any]) -> Any:
+        """
+        Return a memoized result of fn, recomputing it once ttl has expired
+        
+        Falsy results are not cached, so failed lookups are retried.
+        
+        Args:
+            key: Cache key (should include the CLI path)
+            ttl: Time to live in seconds
+            fn: Function computing the value
+            
+        Returns:
+            Cached or freshly computed value
+        """
+        value = self._cache_get(key, ttl)
+        if value is None:
+            value = fn()
+            self._cache_put(key, value)
+        return value
+    
+    def _cache_get(self, key: Tuple[Any, ...], ttl: float) -> Any:
+        """
+        Look up a memoized result
+        
+        Args:
+            key: Cache key
+            ttl: Time to live in seconds
+            
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        hit = self._command_cache.get(key)
+        if hit and time.monotonic() - hit[0] < ttl:
+            return hit[1]
+        return None
+    
+    def _cache_put(self, key: Tuple[Any, ...], value: Any) -> None:
+        """Memoize a result (falsy values are not cached)"""
+        if value:
+            self._command_cache[key] = (time.monotonic(), value)
+    
+    def _invalidate_cache(self, key: Tuple[Any, ...]) -> None:
+        """Drop a memoized result so the next lookup hits qlik-cli again"""
+        self._command_cache.pop(key, None)
+    
+    def invalidate_apps(self) -> None:
+        """
+        Drop all cached app_list and app_get results
+        
+        Called after operations that create or change apps, or that may
+        switch the tenant, so subsequent listings and searches are fresh.
+        """
+        for key in list(self._command_cache):
+            if key[0] in ('app_list', 'app_get'):
+                self._command_cache.pop(key, None)
+    
+    def _rest_api_enabled(self) -> bool:
+        """
+        Check whether read-only lookups may call the Qlik Cloud REST API directly
+        
+        Requires rest_api_lookups to be enabled, direct authentication (tenant URL
+        and API key, contexts disabled) and httpx; otherwise qlik-cli is used.
+        """
+        # Checked last so httpx is only imported when REST lookups are configured
+        return (self.config.qlik.rest_api_lookups
+                and self.config.is_direct_mode()
+                and _optional_import('httpx') is not None)
+    
+    def _rest_client_options(self) -> Dict[str, Any]:
+        """Keyword arguments shared by the sync and async REST clients"""
+        httpx = _optional_import('httpx')
+        return {
+            'base_url': self.config.qlik.tenant_url.rstrip('/'),
+            'headers': {'Authorization': f'Bearer {self.config.qlik.api_key}'},
+            'http2': _optional_import('h2') is not None,
+            'timeout': self.timeout,
+            'limits': httpx.Limits(max_keepalive_connections=_REST_MAX_KEEPALIVE_CONNECTIONS),
+        }
+    
+    def _get_http_client(self) -> Any:
+        """
+        Get the persistent REST client, creating it on first use
+        
+        The client keeps its TLS connections to the tenant alive between calls.
+        """
+        if self._http_client is None:
+            with self._http_client_lock:
+                if self._http_client is None:
+                    httpx = _optional_import('httpx')
+                    self._http_client = httpx.Client(**self._rest_client_options())
+        return self._http_client
+    
+    def _rest_get_paged(self, path: str, params: Dict[str, Any], max_items: int) -> List[Dict[str, Any]]:
+        """
+        Collect items from a paginated Qlik Cloud REST endpoint
+        
+        Follows the links.next cursor until max_items items have been read
+        or there are no more pages.
+        
+        Args:
+            path: API path relative to the tenant URL
+            params: Query parameters for the first page
+            max_items: Maximum number of items to collect
+            
+        Returns:
+            List of item dictionaries from the responses' data arrays
+            
+        Raises:
+            QlikCLIError: If a request fails
+        """
+        httpx = _optional_import('httpx')
+        client = self._get_http_client()
+        items: List[Dict[str, Any]] = []
+        url: Optional[str] = path
+        logger.info("Requesting Qlik Cloud REST endpoint: %s", path)
+        try:
+            while url and len(items) < max_items:
+                response = client.get(url, params=params)
+                response.raise_for_status()
+                page = _json_loads(response.content)
+                items.extend(page.get('data') or [])
+                url = _next_page_url(page)
+                # The next link already carries the query string
+                params = None
+        except httpx.HTTPError as e:
+            error_msg = f"Qlik Cloud REST request failed: {str(e)}"
+            logger.error(error_msg)
+            raise QlikCLIError(error_msg)
+        return items[:max_items]
+    
+    async def _rest_get_paged_async(self, path: str, params: Dict[str, Any],
+                                    max_items: int) -> List[Dict[str, Any]]:
+        """
+        Collect items from a paginated Qlik Cloud REST endpoint without blocking
+        
+        Behaves like _rest_get_paged. The async client is bound to the running
+        event loop, so one is opened per call and shared by all of its pages.
+        
+        Raises:
+            QlikCLIError: If a request fails
+        """
+        httpx = _optional_import('httpx')
+        items: List[Dict[str, Any]] = []
+        url: Optional[str] = path
+        logger.info("Requesting Qlik Cloud REST endpoint (async): %s", path)
+        try:
+            async with httpx.AsyncClient(**self._rest_client_options()) as client:
+                while url and len(items) < max_items:
+                    response = await client.get(url, params=params)
+                    response.raise_for_status()
+                    page = _json_loads(response.content)
+                    items.extend(page.get('data') or [])
+                    url = _next_page_url(page)
+                    params = None
+        except httpx.HTTPError as e:
+            error_msg = f"Qlik Cloud REST request failed: {str(e)}"
+            logger.error(error_msg)
+            raise QlikCLIError(error_msg)
+        return items[:max_items]
+    
+    def _rest_lookup_names(self, resource: str, ids: Iterable[str]) -> Dict[str, str]:
+        """
+        Look up the names of Qlik Cloud users or spaces by ID
+        
+        Names are cached for _REST_NAME_TTL seconds. An ID whose lookup fails
+        maps to '', so a listing never fails just because a name is missing.
+        
+        Args:
+            resource: API collection path, e.g. '/api/v1/users'
+            ids: Resource IDs (empty ones are skipped)
+            
+        Returns:
+            Dictionary of ID -> name
+        """
+        names, missing = self._cached_rest_names(resource, ids)
+        if missing:
+            httpx = _optional_import('httpx')
+            client = self._get_http_client()
+            for resource_id in missing:
+                try:
+                    response = client.get(f"{resource}/{quote(resource_id, safe='')}")
+                    response.raise_for_status()
+                    names[resource_id] = self._store_rest_name(resource, resource_id, response.content)
+                except (httpx.HTTPError, ValueError) as e:
+                    logger.warning("Could not look up %s/%s: %s", resource, resource_id, e)
+                    names[resource_id] = ''
+        return names
+    
+    async def _rest_lookup_names_async(self, resource: str, ids: Iterable[str]) -> Dict[str, str]:
+        """Async variant of _rest_lookup_names (uncached names are fetched concurrently)"""
+        names, missing = self._cached_rest_names(resource, ids)
+        if missing:
+            httpx = _optional_import('httpx')
+            
+            async def lookup(client: Any, resource_id: str) -> str:
+                try:
+                    response = await client.get(f"{resource}/{quote(resource_id, safe='')}")
+                    response.raise_for_status()
+                    return self._store_rest_name(resource, resource_id, response.content)
+                except (httpx.HTTPError, ValueError) as e:
+                    logger.warning("Could not look up %s/%s: %s", resource, resource_id, e)
+                    return ''
+            
+            async with httpx.AsyncClient(**self._rest_client_options()) as client:
+                found = await asyncio.gather(*[lookup(client, resource_id) for resource_id in missing])
+            names.update(zip(missing, found))
+        return names
+    
+    def _cached_rest_names(self, resource: str,
+                           ids: Iterable[str]) -> Tuple[Dict[str, str], List[str]]:
+        """Split ids into cached names and the IDs that still need a lookup"""
+        names: Dict[str, str] = {}
+        missing: List[str] = []
+        for resource_id in set(filter(None, ids)):
+            name = self._cache_get(self._rest_name_cache_key(resource, resource_id), _REST_NAME_TTL)
+            if name is None:
+                missing.append(resource_id)
+            else:
+                names[resource_id] = name
+        return names, missing
+    
+    def _store_rest_name(self, resource: str, resource_id: str, content: bytes) -> str:
+        """Extract the name from a REST resource response and cache it"""
+        name = (_json_loads(content) or {}).get('name') or ''
+        self._cache_put(self._rest_name_cache_key(resource, resource_id), name)
+        return name
+    
+    def _rest_name_cache_key(self, resource: str, resource_id: str) -> Tuple[Any, ...]:
+        """Cache key for a REST name lookup (includes the tenant)"""
+        return ('rest_name', self.config.qlik.tenant_url, resource, resource_id)
+    
+    def close(self) -> None:
+        """
+        Close the persistent REST client, if one was opened
+        
+        Call this on shutdown; a later REST lookup opens a new client.
+        """
+        with self._http_client_lock:
+            client, self._http_client = self._http_client, None
+        if client is not None:
+            client.close()
+    
     def _validate_cli_available(self) -> bool:
-        """Check if qlik-cli is available and working"""
+        """
+        Check if qlik-cli is available and working
+        
+        The result is shared by all instances and keyed by the executable's
+        modification time, so it is only probed again when the binary changes.
+        If the executable cannot be located, a failed probe is not cached and a
+        successful one is reused for _CLI_AVAILABLE_TTL seconds.
+        """
+        mtime = self._cli_mtime()
+        if mtime is None:
+            return self._cached(('cli_available', self.cli_path), _CLI_AVAILABLE_TTL, self._probe_cli)
+        return self._cached(('cli_available', self.cli_path, mtime), float('inf'), self._probe_cli)
+    
+    def _cli_mtime(self) -> Optional[int]:
+        """Modification time of the qlik-cli executable (ns), or None if it cannot be located"""
+        try:
+            return os.stat(shutil.which(self.cli_path)).st_mtime_ns
+        except (OSError, TypeError):
+            return None
+    
+    @classmethod
+    def invalidate_cli_cache(cls) -> None:
+        """Forget cached qlik-cli availability checks (e.g. in tests)"""
+        for key in list(cls._command_cache):
+            if key[0] == 'cli_available':
+                cls._command_cache.pop(key, None)
+    
+    @classmethod
+    def clear_cache(cls) -> None:
+        """
+        Forget all cached qlik-cli results and path checks
+        
+        Use after changing tenants or files outside this server, when the
+        short cache lifetimes should not be waited out.
+        """
+        cls._command_cache.clear()
+        _path_check_cache.clear()
+    
+    def _probe_cli(self) -> bool:
+        """Run qlik-cli version to check that the executable works"""
         try:
             result = subprocess.run(
                 [self.cli_path, 'version'],
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=10
             )
             return result.returncode == 0
@@ -77,11 +617,24 @@ class QlikCLI:
             True if file exists and is readable, False otherwise
         """
         try:
-            file_path = Path(path)
-            return file_path.exists() and file_path.is_file()
-        except (OSError, ValueError):
+            # A single stat (isfile is False for missing paths as well),
+            # memoized briefly since app_build re-checks the same sources
+            return _cached_path_check('file', path, _is_file)
+        except (OSError, ValueError, TypeError):
             return False
     
+    def _validate_file_paths(self, paths: Iterable[str]) -> Dict[str, bool]:
+        """
+        Validate several file paths, checking each distinct path only once
+        
+        Args:
+            paths: File paths to validate (duplicates allowed)
+            
+        Returns:
+            Dictionary mapping each distinct path to its _validate_file_path result
+        """
+        return {path: self._validate_file_path(path) for path in dict.fromkeys(paths)}
+    
     def _validate_directory_path(self, path: str) -> bool:
         """
         Validate that a directory path exists or can be created
@@ -93,13 +646,8 @@ class QlikCLI:
             True if directory exists or can be created, False otherwise
         """
         try:
-            dir_path = Path(path)
-            if dir_path.exists():
-                return dir_path.is_dir()
-            # Check if parent directory exists and is writable
-            parent = dir_path.parent
-            return parent.exists() and parent.is_dir() and os.access(parent, os.W_OK)
-        except (OSError, ValueError):
+            return _cached_path_check('directory', path, _is_directory_or_creatable)
+        except (OSError, ValueError, TypeError):
             return False
     
     def _validate_tenant_url(self, tenant_url: str) -> bool:
@@ -113,21 +661,22 @@ class QlikCLI:
             True if URL format is valid, False otherwise
         """
         try:
-            parsed = urlparse(tenant_url)
+            parsed = urlsplit(tenant_url)
             # Check if it's a valid URL with https scheme
             if parsed.scheme != 'https':
                 return False
+            # Credentials in the URL could redirect the API key to another host
+            if '@' in parsed.netloc:
+                return False
+            # An explicit port is allowed but must be numeric (raises ValueError otherwise)
+            parsed.port
+            # hostname is already lowercased and stripped of the port
+            host = parsed.hostname or ''
             # Check if it looks like a Qlik Cloud URL
-            if not parsed.netloc:
+            if len(host) <= len(_QLIK_CLOUD_HOST_SUFFIX) or len(host) > 253 or '..' in host:
                 return False
-            # Basic pattern check for Qlik Cloud domains
-            qlik_patterns = [
-                r'.*\.qlikcloud\.com$',
-                r'.*\.us\.qlikcloud\.com$',
-                r'.*\.eu\.qlikcloud\.com$',
-                r'.*\.ap\.qlikcloud\.com$'
-            ]
-            return any(re.match(pattern, parsed.netloc) for pattern in qlik_patterns)
+            # Basic check for Qlik Cloud domains (covers all regional hosts)
+            return host.endswith(_QLIK_CLOUD_HOST_SUFFIX)
         except Exception:
             return False
     
@@ -142,11 +691,14 @@ class QlikCLI:
             True if directory exists or was created successfully
         """
         try:
-            dir_path = Path(path)
-            dir_path.mkdir(parents=True, exist_ok=True)
+            # Skip the mkdir when the directory was seen moments ago
+            if _cached_path_check('isdir', path, os.path.isdir):
+                return True
+            os.makedirs(path, exist_ok=True)
+            _invalidate_path_cache(path)
             return True
-        except (OSError, PermissionError) as e:
-            logger.error(f"Failed to create directory {path}: {str(e)}")
+        except (OSError, PermissionError, ValueError, TypeError) as e:
+            logger.error("Failed to create directory %s: %s", path, e)
             return False
     
     def _get_available_disk_space(self, path: str) -> int:
@@ -156,16 +708,32 @@ class QlikCLI:
         Args:
             path: Path to check disk space for
             
+        Results are reused per file system (device) for _DISK_SPACE_TTL
+        seconds, so bulk exports into one folder do not query it every time.
+        
         Returns:
             Available disk space in bytes, -1 if unable to determine
         """
+        try:
+            cache_key = ('disk_space', os.stat(path).st_dev)
+        except (OSError, ValueError, TypeError):
+            return self._query_available_disk_space(path)
+        cached = self._cache_get(cache_key, _DISK_SPACE_TTL)
+        if cached is not None:
+            return cached
+        free = self._query_available_disk_space(path)
+        if free != -1:
+            self._cache_put(cache_key, free)
+        return free
+    
+    def _query_available_disk_space(self, path: str) -> int:
+        """Ask the operating system for the available disk space at path"""
         try:
             statvfs = os.statvfs(path)
             return statvfs.f_frsize * statvfs.f_bavail
         except (OSError, AttributeError):
             # Fallback for Windows
             try:
-                import shutil
                 total, used, free = shutil.disk_usage(path)
                 return free
             except Exception:
@@ -181,8 +749,7 @@ class QlikCLI:
         Returns:
             True if format is valid
         """
-        valid_formats = ['qvf', 'json', 'xlsx']
-        return format_type.lower() in valid_formats
+        return format_type.lower() in _VALID_EXPORT_FORMATS
     
     def _build_base_command(self) -> List[str]:
         """
@@ -191,24 +758,87 @@ class QlikCLI:
         Returns:
             List of command components
         """
-        cmd = [self.cli_path]
+        return list(self._base_cmd_prefix)
+    
+    def _mask_command(self, command: List[str], mask_sensitive: bool) -> List[str]:
+        """
+        Get a version of a command that is safe to log
+        
+        Args:
+            command: List of command components
+            mask_sensitive: Whether to mask sensitive information
+            
+        Returns:
+            Command components with sensitive values masked if requested (the
+            command itself when no masking is needed; callers must not modify it)
+        """
+        if not mask_sensitive:
+            return command
+        # Mask API keys and other sensitive data in a single pass
+        return command[:1] + ['***MASKED***' if previous in _SENSITIVE_FLAGS else arg
+                              for previous, arg in zip(command, command[1:])]
+    
+    def _process_command_result(self,
+                                returncode: int,
+                                stdout: Union[str, bytes],
+                                stderr: str,
+                                command_str: str,
+                                mask_sensitive: bool) -> Dict[str, Any]:
+        """
+        Log a finished qlik-cli command and convert it into a result dictionary
         
-        # Add global flags from config if available
-        if self.config.qlik.tenant_url:
-            cmd.extend(['--server', self.config.qlik.tenant_url])
+        Args:
+            returncode: Process return code
+            stdout: Standard output (bytes when captured with binary_output)
+            stderr: Decoded standard error
+            command_str: Command line as it may be logged (masked if needed)
+            mask_sensitive: Whether sensitive information must be kept out of logs
+            
+        Returns:
+            Dictionary containing command result
+            
+        Raises:
+            QlikCLIError: If the command returned a non-zero exit code
+        """
+        logger.debug("Command return code: %s", returncode)
+        logger.debug("Command stdout: %s", stdout)
+        if stderr and not mask_sensitive:
+            logger.debug("Command stderr: %s", stderr)
         
-        if self.config.server.debug:
-            cmd.append('--verbose')
+        if returncode != 0:
+            error_msg = f"qlik-cli command failed with return code {returncode}"
+            if stderr:
+                error_msg += f": {stderr}"
+            raise QlikCLIError(error_msg, returncode)
         
-        return cmd
+        return {
+            'success': True,
+            'returncode': returncode,
+            'stdout': stdout,
+            'stderr': stderr,
+            'command': command_str
+        }
     
-    def _execute_command(self, command: List[str], mask_sensitive: bool = False) -> Dict[str, Any]:
+    def _execute_command(self,
+                         command: List[str],
+                         mask_sensitive: bool = False,
+                         ignore_output: bool = False,
+                         binary_output: bool = False,
+                         spool_output: bool = False) -> Dict[str, Any]:
         """
         Execute qlik-cli command with proper error handling
         
         Args:
             command: List of command components
             mask_sensitive: Whether to mask sensitive information in logs
+            ignore_output: Discard stdout/stderr instead of capturing them, for
+                callers that only need the return code
+            binary_output: Return stdout as undecoded bytes, for callers that
+                feed it straight into the JSON parser
+            spool_output: Write stdout/stderr to temporary files instead of
+                pipes and keep at most _SPOOLED_OUTPUT_LIMIT bytes of each, for
+                long-running commands that may log a lot and whose output is
+                not parsed (app export)
             
         Returns:
             Dictionary containing command result
@@ -216,43 +846,48 @@ class QlikCLI:
         Raises:
             QlikCLIError: If command execution fails
         """
-        # Create masked command for logging if needed
-        log_command = command.copy()
-        if mask_sensitive:
-            # Mask API keys and other sensitive data
-            for i, arg in enumerate(log_command):
-                if i > 0 and log_command[i-1] in ['--api-key', '--token']:
-                    log_command[i] = '***MASKED***'
+        # Create masked command line for logging if needed; joined once and
+        # reused for the result dictionary
+        command_str = ' '.join(self._mask_command(command, mask_sensitive))
         
-        logger.info(f"Executing qlik-cli command: {' '.join(log_command)}")
+        logger.info("Executing qlik-cli command: %s", command_str)
         
         try:
-            result = subprocess.run(
-                command,
-                capture_output=True,
-                text=True,
-                timeout=self.timeout,
-                env=os.environ.copy()
-            )
+            # qlik-cli has no interactive/RPC mode (see qlik_cli_reference.txt),
+            # so every command is a one-shot process; a persistent worker
+            # session cannot be used to amortize startup cost.
+            if spool_output and not ignore_output:
+                with tempfile.TemporaryFile() as stdout_spool, tempfile.TemporaryFile() as stderr_spool, \
+                        self._process_slots:
+                    result = subprocess.run(
+                        command,
+                        stdout=stdout_spool,
+                        stderr=stderr_spool,
+                        timeout=self.timeout,
+                        env=self._env
+                    )
+                    raw_stdout = _read_spooled_output(stdout_spool)
+                    raw_stderr = _read_spooled_output(stderr_spool)
+                stdout = raw_stdout if binary_output else _decode_output(raw_stdout)
+                return self._process_command_result(
+                    result.returncode, stdout, _decode_output(raw_stderr), command_str, mask_sensitive
+                )
             
-            logger.debug(f"Command return code: {result.returncode}")
-            logger.debug(f"Command stdout: {result.stdout}")
-            if result.stderr and not mask_sensitive:
-                logger.debug(f"Command stderr: {result.stderr}")
-            
-            if result.returncode != 0:
-                error_msg = f"qlik-cli command failed with return code {result.returncode}"
-                if result.stderr:
-                    error_msg += f": {result.stderr}"
-                raise QlikCLIError(error_msg)
-            
-            return {
-                'success': True,
-                'returncode': result.returncode,
-                'stdout': result.stdout,
-                'stderr': result.stderr,
-                'command': ' '.join(log_command)
-            }
+            output_target = subprocess.DEVNULL if ignore_output else subprocess.PIPE
+            with self._process_slots:
+                result = subprocess.run(
+                    command,
+                    stdout=output_target,
+                    stderr=output_target,
+                    text=not binary_output,
+                    timeout=self.timeout,
+                    env=self._env
+                )
+            
+            stdout = (result.stdout or b'') if binary_output else (result.stdout or '')
+            return self._process_command_result(
+                result.returncode, stdout, _decode_output(result.stderr), command_str, mask_sensitive
+            )
             
         except subprocess.TimeoutExpired:
             error_msg = f"qlik-cli command timed out after {self.timeout} seconds"
@@ -267,14 +902,105 @@ class QlikCLI:
         except Exception as e:
             error_msg = f"Unexpected error executing qlik-cli command: {str(e)}"
             logger.error(error_msg)
+            raise QlikCLIError(error_msg, e.returncode if isinstance(e, QlikCLIError) else None)
+    
+    async def _execute_command_async(self,
+                                     command: List[str],
+                                     mask_sensitive: bool = False,
+                                     ignore_output: bool = False,
+                                     binary_output: bool = False) -> Dict[str, Any]:
+        """
+        Execute qlik-cli command asynchronously with proper error handling
+        
+        Behaves like _execute_command, but awaits the process on the event loop
+        so that independent commands can run concurrently (e.g. via asyncio.gather).
+        
+        Args:
+            command: List of command components
+            mask_sensitive: Whether to mask sensitive information in logs
+            ignore_output: Discard stdout/stderr instead of capturing them, for
+                callers that only need the return code
+            binary_output: Return stdout as undecoded bytes, for callers that
+                feed it straight into the JSON parser
+            
+        Returns:
+            Dictionary containing command result
+            
+        Raises:
+            QlikCLIError: If command execution fails
+        """
+        # Create masked command line for logging if needed; joined once and
+        # reused for the result dictionary
+        command_str = ' '.join(self._mask_command(command, mask_sensitive))
+        
+        logger.info("Executing qlik-cli command (async): %s", command_str)
+        
+        try:
+            output_target = asyncio.subprocess.DEVNULL if ignore_output else asyncio.subprocess.PIPE
+            # Shares the process cap with _execute_command
+            await self._acquire_process_slot()
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    *command,
+                    stdout=output_target,
+                    stderr=output_target,
+                    env=self._env
+                )
+                
+                try:
+                    stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=self.timeout)
+                except asyncio.TimeoutError:
+                    process.kill()
+                    await process.wait()
+                    raise
+            finally:
+                self._process_slots.release()
+            
+            return self._process_command_result(
+                process.returncode,
+                (stdout or b'') if binary_output else _decode_output(stdout),
+                _decode_output(stderr),
+                command_str,
+                mask_sensitive
+            )
+            
+        except asyncio.TimeoutError:
+            error_msg = f"qlik-cli command timed out after {self.timeout} seconds"
+            logger.error(error_msg)
             raise QlikCLIError(error_msg)
+        
+        except FileNotFoundError:
+            error_msg = f"qlik-cli executable not found: {self.cli_path}"
+            logger.error(error_msg)
+            raise QlikCLIError(error_msg)
+        
+        except Exception as e:
+            error_msg = f"Unexpected error executing qlik-cli command: {str(e)}"
+            logger.error(error_msg)
+            raise QlikCLIError(error_msg, e.returncode if isinstance(e, QlikCLIError) else None)
     
-    def _parse_json_output(self, output: str) -> List[Dict[str, Any]]:
+    async def _acquire_process_slot(self) -> None:
+        """
+        Take one of the _process_slots without blocking the event loop
+        
+        Waits in a worker thread when all slots are busy. If the caller is
+        cancelled meanwhile, the slot is released as soon as the thread gets it.
+        """
+        if self._process_slots.acquire(blocking=False):
+            return
+        acquire = asyncio.ensure_future(asyncio.to_thread(self._process_slots.acquire))
+        try:
+            await asyncio.shield(acquire)
+        except asyncio.CancelledError:
+            acquire.add_done_callback(lambda _: self._process_slots.release())
+            raise
+    
+    def _parse_json_output(self, output: Union[str, bytes]) -> List[Dict[str, Any]]:
         """
         Parse JSON output from qlik-cli commands
         
         Args:
-            output: Raw JSON output string
+            output: Raw JSON output (str, or bytes from binary_output commands)
             
         Returns:
             List of parsed JSON objects
@@ -282,57 +1008,191 @@ class QlikCLI:
         Raises:
             QlikCLIError: If JSON parsing fails
         """
-        if not output or not output.strip():
+        # isspace() checks for blank output without copying it like strip() would
+        if not output or output.isspace():
             return []
         
+        loads = _json_loads
         try:
             # Try to parse as single JSON object first
             try:
-                parsed = json.loads(output.strip())
+                parsed = loads(output)
                 return [parsed] if isinstance(parsed, dict) else parsed
             except json.JSONDecodeError:
-                # Try to parse as multiple JSON objects (one per line)
+                # Parse as multiple JSON objects (typically one per line) in a
+                # single raw_decode scan instead of a loads call per line
+                text = _decode_output(output)
+                raw_decode = _JSON_DECODER.raw_decode
+                skip_whitespace = _JSON_WHITESPACE.match
                 objects = []
-                for line in output.strip().split('\n'):
-                    line = line.strip()
-                    if line:
-                        try:
-                            obj = json.loads(line)
-                            objects.append(obj)
-                        except json.JSONDecodeError:
-                            # Skip invalid JSON lines
-                            continue
+                pos = skip_whitespace(text, 0).end()
+                end = len(text)
+                while pos < end:
+                    try:
+                        obj, pos = raw_decode(text, pos)
+                        objects.append(obj)
+                    except json.JSONDecodeError:
+                        # Skip the rest of an invalid JSON line
+                        pos = text.find('\n', pos)
+                        if pos == -1:
+                            break
+                    pos = skip_whitespace(text, pos).end()
                 return objects
         except Exception as e:
-            logger.warning(f"Failed to parse JSON output: {str(e)}")
+            logger.warning("Failed to parse JSON output: %s", e)
             raise QlikCLIError(f"Failed to parse command output as JSON: {str(e)}")
     
     def get_cli_version(self) -> Dict[str, Any]:
         """
         Get qlik-cli version information
         
+        The result is keyed by the executable's modification time like
+        _validate_cli_available, so an in-place upgrade is picked up.
+        
         Returns:
             Dictionary containing version information
         """
         cmd = [self.cli_path, '--version']
-        return self._execute_command(cmd)
+        mtime = self._cli_mtime()
+        if mtime is None:
+            return self._cached(('cli_version', self.cli_path), _CLI_VERSION_TTL,
+                                lambda: self._execute_command(cmd))
+        return self._cached(('cli_version', self.cli_path, mtime), float('inf'),
+                            lambda: self._execute_command(cmd))
     
     def validate_connection(self) -> bool:
         """
         Validate connection to Qlik Cloud
         
+        A successful check is reused for _CONNECTION_CHECK_TTL seconds;
+        failures are always re-checked.
+        
         Returns:
             True if connection is valid, False otherwise
         """
+        return self._cached(('connection', self._base_cmd_prefix), _CONNECTION_CHECK_TTL,
+                            self._check_connection)
+    
+    def invalidate_connection(self) -> None:
+        """
+        Drop the cached validate_connection result
+        
+        Call this after an observed authentication failure or a context switch
+        so the next validate_connection checks again.
+        """
+        self._invalidate_cache(('connection', self._base_cmd_prefix))
+    
+    def _check_connection(self) -> bool:
+        """Run the validate_connection check against qlik-cli"""
         try:
             # Try to execute a simple command to test connectivity
             cmd = self._build_base_command()
             cmd.extend(['--help'])
-            result = self._execute_command(cmd)
+            result = self._execute_command(cmd, ignore_output=True)
             return result['success']
         except QlikCLIError:
             return False
     
+    def _build_api_key_check_command(self, api_key: str, tenant_url: str) -> List[str]:
+        """
+        Build the command used to test an API key against a tenant
+        
+        Args:
+            api_key: API key to validate
+            tenant_url: Tenant URL to validate against
+            
+        Returns:
+            List of command components
+        """
+        return [self.cli_path, '--server', tenant_url, '--api-key', api_key, 'user', 'me']
+    
+    def _is_well_formed_api_key(self, api_key: str, tenant_url: str) -> bool:
+        """
+        Cheap structural check of an API key and tenant URL
+        
+        Rejects values that can never authenticate without starting qlik-cli.
+        
+        Args:
+            api_key: API key to check
+            tenant_url: Tenant URL to check
+            
+        Returns:
+            True if both look valid, False otherwise
+        """
+        if not api_key or len(api_key) < _API_KEY_MIN_LENGTH:
+            return False
+        if not _API_KEY_CHARS.issuperset(api_key):
+            return False
+        return self._validate_tenant_url(tenant_url)
+    
+    def _api_key_cache_key(self, api_key: str, tenant_url: str) -> Tuple[bytes, str]:
+        """Build the API key validation cache key (hashed, never the raw key)"""
+        return hashlib.sha256(api_key.encode()).digest(), tenant_url
+    
+    def _cached_api_key_validation(self, cache_key: Tuple[bytes, str]) -> Optional[bool]:
+        """
+        Look up a recent API key validation result
+        
+        Successful validations are reused for _API_KEY_CACHE_TTL seconds,
+        keys the tenant rejected for the shorter _API_KEY_NEGATIVE_CACHE_TTL.
+        
+        Args:
+            cache_key: Key from _api_key_cache_key
+            
+        Returns:
+            The cached result, or None if there is no fresh one
+        """
+        with self._api_key_cache_lock:
+            entry = self._api_key_cache.get(cache_key)
+            if entry is None:
+                return None
+            validated_at, valid = entry
+            ttl = _API_KEY_CACHE_TTL if valid else _API_KEY_NEGATIVE_CACHE_TTL
+            if time.monotonic() - validated_at < ttl:
+                return valid
+            del self._api_key_cache[cache_key]
+            return None
+    
+    def _remember_api_key_validation(self, cache_key: Tuple[bytes, str], valid: bool) -> None:
+        """
+        Record an API key validation result, evicting the oldest entry if full
+        
+        Args:
+            cache_key: Key from _api_key_cache_key
+            valid: Whether the validation succeeded
+        """
+        with self._api_key_cache_lock:
+            self._api_key_cache.pop(cache_key, None)
+            if len(self._api_key_cache) >= _API_KEY_CACHE_SIZE:
+                del self._api_key_cache[next(iter(self._api_key_cache))]
+            self._api_key_cache[cache_key] = (time.monotonic(), valid)
+    
+    def invalidate_api_key(self, api_key: str, tenant_url: str) -> None:
+        """
+        Forget a cached validation result for an API key
+        
+        Call this when the tenant rejects a key (e.g. a 401) so the next
+        validate_api_key call checks it again.
+        
+        Args:
+            api_key: API key to forget
+            tenant_url: Tenant URL it was validated against
+        """
+        with self._api_key_cache_lock:
+            self._api_key_cache.pop(self._api_key_cache_key(api_key, tenant_url), None)
+    
+    def _known_api_key_validity(self, api_key: str, tenant_url: str) -> Optional[bool]:
+        """
+        Answer validate_api_key without qlik-cli where possible
+        
+        Returns:
+            False for malformed keys or URLs, the cached result for recently
+            validated keys, None if qlik-cli has to be asked
+        """
+        if not self._is_well_formed_api_key(api_key, tenant_url):
+            return False
+        return self._cached_api_key_validation(self._api_key_cache_key(api_key, tenant_url))
+    
     def validate_api_key(self, api_key: str, tenant_url: str) -> bool:
         """
         Validate API key against a Qlik Cloud tenant
@@ -344,19 +1204,71 @@ class QlikCLI:
         Returns:
             True if API key is valid, False otherwise
         """
-        logger.info(f"Validating API key against tenant: {tenant_url}")
+        logger.info("Validating API key against tenant: %s", tenant_url)
+        
+        if not self._is_well_formed_api_key(api_key, tenant_url):
+            logger.warning("API key validation failed: malformed API key or tenant URL")
+            return False
+        
+        cache_key = self._api_key_cache_key(api_key, tenant_url)
+        cached_result = self._cached_api_key_validation(cache_key)
+        if cached_result is not None:
+            logger.info("API key was validated recently, skipping qlik-cli check")
+            return cached_result
         
         try:
             # Build a simple command to test authentication
-            cmd = [self.cli_path, '--server', tenant_url, '--api-key', api_key, 'user', 'me']
+            cmd = self._build_api_key_check_command(api_key, tenant_url)
             
             # Execute command with sensitive data masking
+            # (error output is kept to tell a rejected key from other failures)
             result = self._execute_command(cmd, mask_sensitive=True)
             
             # If command succeeds, API key is valid
+            self._remember_api_key_validation(cache_key, True)
+            logger.info("API key validation successful")
+            return True
+            
+        except QlikCLIError as e:
+            logger.warning("API key validation failed: %s", e)
+            # Timeouts, launch and network failures are retried next time
+            if _is_auth_rejection(e):
+                self._remember_api_key_validation(cache_key, False)
+            return False
+    
+    async def validate_api_key_async(self, api_key: str, tenant_url: str) -> bool:
+        """
+        Validate API key against a Qlik Cloud tenant without blocking the event loop
+        
+        Args:
+            api_key: API key to validate
+            tenant_url: Tenant URL to validate against
+            
+        Returns:
+            True if API key is valid, False otherwise
+        """
+        logger.info("Validating API key against tenant (async): %s", tenant_url)
+        
+        if not self._is_well_formed_api_key(api_key, tenant_url):
+            logger.warning("API key validation failed: malformed API key or tenant URL")
+            return False
+        
+        cache_key = self._api_key_cache_key(api_key, tenant_url)
+        cached_result = self._cached_api_key_validation(cache_key)
+        if cached_result is not None:
+            logger.info("API key was validated recently, skipping qlik-cli check")
+            return cached_result
+        
+        try:
+            cmd = self._build_api_key_check_command(api_key, tenant_url)
+            await self._execute_command_async(cmd, mask_sensitive=True)
+            
+            self._remember_api_key_validation(cache_key, True)
             logger.info("API key validation successful")
             return True
             
         except QlikCLIError as e:
-            logger.warning(f"API key validation failed: {str(e)}")
+            logger.warning("API key validation failed: %s", e)
+            if _is_auth_rejection(e):
+                self._remember_api_key_validation(cache_key, False)
             return False
\ No newline at end of file
@@ -6,6 +6,7 @@ This module provides methods for app build and unbuild operations.
 
 import logging
 import os
+from itertools import chain
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Union
 
@@ -14,6 +15,21 @@ from .qlik_cli_base import QlikCLI, QlikCLIError
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# File parameters of app_build in command order: (flag, error label, accepts a list)
+_APP_BUILD_FILE_PARAMS = (
+    ('--connections', 'Connections', False),
+    ('--script', 'Script', False),
+    ('--app-properties', 'App properties', False),
+    ('--dimensions', 'Dimensions', True),
+    ('--measures', 'Measures', True),
+    ('--objects', 'Objects', True),
+    ('--variables', 'Variables', True),
+    ('--bookmarks', 'Bookmarks', True),
+)
+
+# Boolean flags of app_build in command order
+_APP_BUILD_FLAGS = ('--no-data', '--no-reload', '--no-save', '--silent')
+
 
 class QlikAppBuildMixin:
     """Mixin class for app build operations"""
@@ -60,51 +76,89 @@ class QlikAppBuildMixin:
         Raises:
             QlikCLIError: If command execution fails or parameters are invalid
         """
-        logger.info(f"Building Qlik app: {app}")
+        logger.info("Building Qlik app: %s", app)
         
-        # Build command
+        cmd = self._build_app_build_command(
+            app, connections=connections, script=script, dimensions=dimensions,
+            measures=measures, objects=objects, variables=variables, bookmarks=bookmarks,
+            app_properties=app_properties, limit=limit, no_data=no_data,
+            no_reload=no_reload, no_save=no_save, silent=silent
+        )
+        
+        # Execute command
+        result = self._execute_command(cmd)
+        
+        # A build may create or rename apps
+        self.invalidate_apps()
+        return result
+    
+    async def app_build_async(self, app: str, **kwargs) -> Dict[str, Any]:
+        """
+        Execute qlik app build command without blocking the event loop
+        
+        Accepts the same arguments and returns the same result as app_build,
+        so several builds can run concurrently via asyncio.gather.
+        
+        Raises:
+            QlikCLIError: If command execution fails or parameters are invalid
+        """
+        logger.info("Building Qlik app (async): %s", app)
+        
+        cmd = self._build_app_build_command(app, **kwargs)
+        result = await self._execute_command_async(cmd)
+        
+        # A build may create or rename apps
+        self.invalidate_apps()
+        return result
+    
+    def _build_app_build_command(self,
+                                 app: str,
+                                 connections: Optional[str] = None,
+                                 script: Optional[str] = None,
+                                 dimensions: Optional[Union[str, List[str]]] = None,
+                                 measures: Optional[Union[str, List[str]]] = None,
+                                 objects: Optional[Union[str, List[str]]] = None,
+                                 variables: Optional[Union[str, List[str]]] = None,
+                                 bookmarks: Optional[Union[str, List[str]]] = None,
+                                 app_properties: Optional[str] = None,
+                                 limit: Optional[int] = None,
+                                 no_data: bool = False,
+                                 no_reload: bool = False,
+                                 no_save: bool = False,
+                                 silent: bool = False,
+                                 **kwargs) -> List[str]:
+        """
+        Validate app_build parameters and build the qlik app build command
+        
+        Returns:
+            List of command components
+            
+        Raises:
+            QlikCLIError: If parameters are invalid
+        """
+        # Build command with the app parameter
         cmd = self._build_base_command()
-        cmd.extend(['app', 'build'])
+        cmd += ('app', 'build', '--app', app)
         
-        # Add app parameter
-        cmd.extend(['--app', app])
+        # Collect file-based parameters in command order as (flag, path, label)
+        file_params = []
+        file_values = (connections, script, app_properties,
+                       dimensions, measures, objects, variables, bookmarks)
+        for (flag, label, accepts_list), value in zip(_APP_BUILD_FILE_PARAMS, file_values):
+            if not value:
+                continue
+            paths = value if accepts_list and isinstance(value, list) else [value]
+            for file_path in paths:
+                if not isinstance(file_path, str):
+                    raise QlikCLIError(f"{label} file not found: {file_path}")
+                file_params.append((flag, file_path, label))
         
-        # Validate and add file-based parameters
-        if connections:
-            if not self._validate_file_path(connections):
-                raise QlikCLIError(f"Connections file not found: {connections}")
-            cmd.extend(['--connections', connections])
-        
-        if script:
-            if not self._validate_file_path(script):
-                raise QlikCLIError(f"Script file not found: {script}")
-            cmd.extend(['--script', script])
-        
-        if app_properties:
-            if not self._validate_file_path(app_properties):
-                raise QlikCLIError(f"App properties file not found: {app_properties}")
-            cmd.extend(['--app-properties', app_properties])
-        
-        # Handle list parameters (dimensions, measures, objects, variables, bookmarks)
-        def add_list_parameter(param_name: str, param_value: Union[str, List[str], None]):
-            if param_value:
-                if isinstance(param_value, str):
-                    # Single file path
-                    if not self._validate_file_path(param_value):
-                        raise QlikCLIError(f"{param_name.capitalize()} file not found: {param_value}")
-                    cmd.extend([f'--{param_name}', param_value])
-                elif isinstance(param_value, list):
-                    # Multiple file paths
-                    for file_path in param_value:
-                        if not self._validate_file_path(file_path):
-                            raise QlikCLIError(f"{param_name.capitalize()} file not found: {file_path}")
-                        cmd.extend([f'--{param_name}', file_path])
-        
-        add_list_parameter('dimensions', dimensions)
-        add_list_parameter('measures', measures)
-        add_list_parameter('objects', objects)
-        add_list_parameter('variables', variables)
-        add_list_parameter('bookmarks', bookmarks)
+        # Validate each distinct file once, then add them in order
+        valid_paths = self._validate_file_paths(path for _, path, _ in file_params)
+        for flag, path, label in file_params:
+            if not valid_paths[path]:
+                raise QlikCLIError(f"{label} file not found: {path}")
+        cmd.extend(chain.from_iterable((flag, path) for flag, path, _ in file_params))
         
         # Add numeric parameters
         if limit is not None:
@@ -113,17 +167,10 @@ class QlikAppBuildMixin:
             cmd.extend(['--limit', str(limit)])
         
         # Add boolean flags
-        if no_data:
-            cmd.append('--no-data')
-        if no_reload:
-            cmd.append('--no-reload')
-        if no_save:
-            cmd.append('--no-save')
-        if silent:
-            cmd.append('--silent')
+        flag_values = (no_data, no_reload, no_save, silent)
+        cmd.extend(flag for flag, enabled in zip(_APP_BUILD_FLAGS, flag_values) if enabled)
         
-        # Execute command
-        return self._execute_command(cmd)
+        return cmd
     
     def app_unbuild(self,
                     app: str,
@@ -145,7 +192,7 @@ class QlikAppBuildMixin:
         Raises:
             QlikCLIError: If command execution fails or parameters are invalid
         """
-        logger.info(f"Unbuilding Qlik app: {app}")
+        logger.info("Unbuilding Qlik app: %s", app)
         
         # Determine the target directory
         target_dir = self._determine_unbuild_directory(dir)
@@ -162,7 +209,7 @@ class QlikAppBuildMixin:
             # Ensure directory exists
             self._ensure_directory_exists(target_dir)
             cmd.extend(['--dir', target_dir])
-            logger.info(f"Using unbuild directory: {target_dir}")
+            logger.info("Using unbuild directory: %s", target_dir)
         else:
             logger.info("Using qlik-cli default unbuild behavior (current directory)")
         
@@ -176,7 +223,7 @@ class QlikAppBuildMixin:
         # Add directory information to result if available
         if target_dir:
             result['unbuild_directory'] = target_dir
-            logger.info(f"App unbuilt to directory: {target_dir}")
+            logger.info("App unbuilt to directory: %s", target_dir)
         
         return result
     
@@ -192,22 +239,22 @@ class QlikAppBuildMixin:
         """
         # Explicit directory has highest priority
         if explicit_dir:
-            logger.debug(f"Using explicit directory: {explicit_dir}")
+            logger.debug("Using explicit directory: %s", explicit_dir)
             return explicit_dir
         
         # Check for default directory from configuration
         try:
             default_dir = self.config.qlik.get_unbuild_directory()
             if default_dir:
-                logger.debug(f"Using configured default directory: {default_dir}")
+                logger.debug("Using configured default directory: %s", default_dir)
                 return default_dir
         except Exception as e:
-            logger.warning(f"Failed to get unbuild directory from config: {e}")
+            logger.warning("Failed to get unbuild directory from config: %s", e)
         
         # Fallback to environment variable (redundant but safe)
         env_dir = os.getenv('QLIK_DEFAULT_UNBUILD_DIRECTORY')
         if env_dir:
-            logger.debug(f"Using environment variable directory: {env_dir}")
+            logger.debug("Using environment variable directory: %s", env_dir)
             return env_dir
         
         # No directory specified, let qlik-cli use its default behavior
@@ -5,14 +5,130 @@ This module provides methods for app discovery including
 list, get, and search operations.
 """
 
+import asyncio
+import copy
+import heapq
 import logging
-from typing import Dict, List, Optional, Any
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 
-from .qlik_cli_base import QlikCLI, QlikCLIError
+from .qlik_cli_base import QlikCLI, QlikCLIError, _APP_LIST_TTL, _decode_output
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Fields copied as-is from qlik app ls records, with their defaults
+# (tags gets a fresh list when missing)
+_APP_FIELD_DEFAULTS = {
+    'id': '',
+    'name': '',
+    'description': '',
+    'spaceId': '',
+    'createdDate': '',
+    'modifiedDate': '',
+    'published': False,
+    'tags': None,
+    'thumbnail': '',
+    'usage': 'analytics'
+}
+_get_app_fields = itemgetter(*_APP_FIELD_DEFAULTS)
+
+
+def _app_fields(app_data: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Extract the _APP_FIELD_DEFAULTS fields of an app record in one itemgetter call"""
+    try:
+        return _get_app_fields(app_data)
+    except KeyError:
+        # Some fields are missing; fill them in from the defaults
+        return _get_app_fields({**_APP_FIELD_DEFAULTS, 'tags': [], **app_data})
+
+
+# Additional fields of qlik app get records, with their defaults
+# (encryption, customProperties and attributes get fresh containers when missing)
+_APP_DETAIL_FIELD_DEFAULTS = {
+    'fileSize': 0,
+    'lastReloadTime': '',
+    'hasData': False,
+    'isDirectQueryMode': False,
+    'encryption': None,
+    'customProperties': None,
+    'originAppId': '',
+    'targetAppId': '',
+    'attributes': None
+}
+_get_app_detail_fields = itemgetter(*_APP_DETAIL_FIELD_DEFAULTS)
+
+
+def _app_detail_fields(app_data: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Extract the _APP_DETAIL_FIELD_DEFAULTS fields of an app record in one itemgetter call"""
+    try:
+        return _get_app_detail_fields(app_data)
+    except KeyError:
+        return _get_app_detail_fields({**_APP_DETAIL_FIELD_DEFAULTS, 'encryption': {},
+                                       'customProperties': [], 'attributes': [], **app_data})
+
+
+# Largest extra relevance for a substring match covering the whole app name / tag
+_NAME_COVERAGE_BONUS = 5
+_TAG_COVERAGE_BONUS = 1
+
+
+
+# app_search match reasons by bit mask (1 = name, 2 = description, 4 = tags)
+_NAME_MATCH = 1
+_MATCH_REASONS = tuple(
+    tuple(reason for bit, reason in ((1, 'name'), (2, 'description'), (4, 'tags')) if bits & bit)
+    for bits in range(8)
+)
+
+
+def _search_terms(folded_query: str) -> Tuple[str, ...]:
+    """
+    Split a case-folded search query into the terms that must all occur
+    
+    Terms contained in another term are dropped, since the longer term
+    implies them.
+    
+    Returns:
+        The terms, or an empty tuple for single-term queries
+    """
+    words = set(folded_query.split())
+    if len(words) < 2:
+        return ()
+    return tuple(word for word in words
+                 if not any(word != other and word in other for other in words))
+
+
+def _coverage(folded_query: str, text: str) -> float:
+    """Share of text covered by a matching query (at most 1)"""
+    return min(1.0, len(folded_query) / len(text)) if text else 0.0
+
+
+def _item_tags(item: Dict[str, Any]) -> List[str]:
+    """
+    Get the tag names of a Qlik Cloud items API record
+    
+    The items API lists tags as {id, name} objects under meta.tags; plain
+    tag names (as in qlik-cli output) are taken as they are.
+    """
+    tags = (item.get('meta') or {}).get('tags') or item.get('tags') or []
+    return [tag.get('name', '') if isinstance(tag, dict) else tag for tag in tags]
+
+
+def _copy_app_list_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy a cached app_list result so callers cannot modify the cache
+    
+    Each app dict and its tags list are copied; all other app values are
+    immutable, so this is cheaper than a deepcopy of the whole listing.
+    """
+    result = copy.copy(result)
+    result['apps'] = [{**app, 'tags': list(app['tags'])} if app.get('tags') else dict(app)
+                      for app in result['apps']]
+    return result
+
 
 class QlikAppDiscoveryMixin:
     """Mixin class for app discovery operations"""
@@ -22,7 +138,8 @@ class QlikAppDiscoveryMixin:
                  collection_id: Optional[str] = None, 
                  owner: Optional[str] = None,
                  limit: int = 50,
-                 offset: int = 0) -> Dict[str, Any]:
+                 offset: int = 0,
+                 include_raw: bool = False) -> Dict[str, Any]:
         """
         List available Qlik applications with filtering options
         
@@ -32,39 +149,177 @@ class QlikAppDiscoveryMixin:
             owner: Filter by app owner
             limit: Maximum number of apps to return (default: 50)
             offset: Number of apps to skip (default: 0)
+            include_raw: Also return the unparsed qlik-cli output as raw_output
+                (off by default; it can be several MB on large tenants)
             
         Returns:
-            Dictionary containing list of apps and metadata
+            Dictionary containing list of apps and metadata (results are cached
+            briefly; see invalidate_apps)
             
         Raises:
             QlikCLIError: If listing apps fails
         """
-        logger.info(f"Listing Qlik apps with filters: space_id={space_id}, owner={owner}, limit={limit}")
+        return _copy_app_list_result(
+            self._get_cached_app_list(space_id, collection_id, owner, limit, offset, include_raw))
+    
+    def _get_cached_app_list(self,
+                             space_id: Optional[str],
+                             collection_id: Optional[str],
+                             owner: Optional[str],
+                             limit: int,
+                             offset: int,
+                             include_raw: bool) -> Dict[str, Any]:
+        """
+        app_list without copying: returns the shared cached result, which
+        callers must not modify (app_search relies on its identity to reuse
+        its search indexes)
+        """
+        cache_key = self._app_list_cache_key(space_id, collection_id, owner, limit, offset, include_raw)
+        cached = self._cache_get(cache_key, _APP_LIST_TTL)
+        if cached is not None:
+            logger.debug("Using cached app list for filters: space_id=%s, owner=%s, limit=%s", space_id, owner, limit)
+            return cached
+        
+        logger.info("Listing Qlik apps with filters: space_id=%s, owner=%s, limit=%s", space_id, owner, limit)
+        
+        # The items API filters owners by user ID while qlik-cli takes the
+        # owner as given, so owner filters always go through qlik-cli
+        if not owner and self._rest_api_enabled():
+            # Direct REST lookup over the persistent connection, no qlik-cli process
+            path, params = self._build_app_items_request(space_id, collection_id, limit + offset)
+            items = self._rest_get_paged(path, params, limit + offset)[offset:]
+            owner_names = self._rest_lookup_names('/api/v1/users', [item.get('ownerId', '') for item in items])
+            space_names = self._rest_lookup_names('/api/v1/spaces', [item.get('spaceId', '') for item in items])
+            apps_result = self._process_app_items(items, owner_names, space_names,
+                                                  space_id, collection_id, owner, limit, offset)
+            if include_raw:
+                apps_result['raw_output'] = ''
+        else:
+            cmd = self._build_app_list_command(space_id, collection_id, owner, limit, offset)
+            
+            # Execute command
+            result = self._execute_command(cmd, binary_output=True)
+            
+            apps_result = self._process_app_list_result(result, space_id, collection_id, owner, limit, offset)
+            if include_raw:
+                apps_result['raw_output'] = _decode_output(result['stdout'])
+        self._cache_put(cache_key, apps_result)
+        return apps_result
+    
+    async def app_list_async(self,
+                             space_id: Optional[str] = None,
+                             collection_id: Optional[str] = None,
+                             owner: Optional[str] = None,
+                             limit: int = 50,
+                             offset: int = 0,
+                             include_raw: bool = False) -> Dict[str, Any]:
+        """
+        List available Qlik applications without blocking the event loop
+        
+        Accepts the same arguments and returns the same result as app_list.
         
+        Raises:
+            QlikCLIError: If listing apps fails
+        """
+        return _copy_app_list_result(
+            await self._get_cached_app_list_async(space_id, collection_id, owner, limit, offset, include_raw))
+    
+    async def _get_cached_app_list_async(self,
+                                         space_id: Optional[str],
+                                         collection_id: Optional[str],
+                                         owner: Optional[str],
+                                         limit: int,
+                                         offset: int,
+                                         include_raw: bool) -> Dict[str, Any]:
+        """Async variant of _get_cached_app_list"""
+        cache_key = self._app_list_cache_key(space_id, collection_id, owner, limit, offset, include_raw)
+        cached = self._cache_get(cache_key, _APP_LIST_TTL)
+        if cached is not None:
+            return cached
+        
+        logger.info("Listing Qlik apps (async) with filters: space_id=%s, owner=%s, limit=%s", space_id, owner, limit)
+        
+        if not owner and self._rest_api_enabled():
+            path, params = self._build_app_items_request(space_id, collection_id, limit + offset)
+            items = (await self._rest_get_paged_async(path, params, limit + offset))[offset:]
+            owner_names, space_names = await asyncio.gather(
+                self._rest_lookup_names_async('/api/v1/users', [item.get('ownerId', '') for item in items]),
+                self._rest_lookup_names_async('/api/v1/spaces', [item.get('spaceId', '') for item in items]))
+            apps_result = self._process_app_items(items, owner_names, space_names,
+                                                  space_id, collection_id, owner, limit, offset)
+            if include_raw:
+                apps_result['raw_output'] = ''
+        else:
+            cmd = self._build_app_list_command(space_id, collection_id, owner, limit, offset)
+            result = await self._execute_command_async(cmd, binary_output=True)
+            
+            apps_result = self._process_app_list_result(result, space_id, collection_id, owner, limit, offset)
+            if include_raw:
+                apps_result['raw_output'] = _decode_output(result['stdout'])
+        self._cache_put(cache_key, apps_result)
+        return apps_result
+    
+    def _app_list_cache_key(self,
+                            space_id: Optional[str],
+                            collection_id: Optional[str],
+                            owner: Optional[str],
+                            limit: int,
+                            offset: int,
+                            include_raw: bool) -> tuple:
+        """Cache key for app_list results (includes the tenant via the base command)"""
+        return ('app_list', self._base_cmd_prefix, space_id, collection_id, owner, limit, offset, include_raw)
+    
+    def _build_app_list_command(self,
+                                space_id: Optional[str],
+                                collection_id: Optional[str],
+                                owner: Optional[str],
+                                limit: int,
+                                offset: int) -> List[str]:
+        """
+        Build the qlik app ls command for the given filters
+        
+        Returns:
+            List of command components
+        """
         # Build command
         cmd = self._build_base_command()
-        cmd.extend(['app', 'ls', '--json'])
+        cmd += ('app', 'ls', '--json')
         
         # Add filtering parameters
         if space_id:
-            cmd.extend(['--space', space_id])
+            cmd += ('--space', space_id)
         
         if collection_id:
-            cmd.extend(['--collection', collection_id])
+            cmd += ('--collection', collection_id)
         
         if owner:
-            cmd.extend(['--owner', owner])
+            cmd += ('--owner', owner)
         
         # Add pagination parameters
         if limit != 50:  # Only add if different from default
-            cmd.extend(['--limit', str(limit)])
+            cmd += ('--limit', str(limit))
         
         if offset > 0:
-            cmd.extend(['--offset', str(offset)])
+            cmd += ('--offset', str(offset))
         
-        # Execute command
-        result = self._execute_command(cmd)
+        return cmd
+    
+    def _process_app_list_result(self,
+                                 result: Dict[str, Any],
+                                 space_id: Optional[str],
+                                 collection_id: Optional[str],
+                                 owner: Optional[str],
+                                 limit: int,
+                                 offset: int) -> Dict[str, Any]:
+        """
+        Structure the output of qlik app ls into the app_list result
         
+        Returns:
+            Dictionary containing list of apps and metadata
+            
+        Raises:
+            QlikCLIError: If the output cannot be processed
+        """
         # Parse JSON output
         try:
             apps_data = self._parse_json_output(result['stdout'])
@@ -72,50 +327,142 @@ class QlikAppDiscoveryMixin:
             # Process and structure app information
             apps = []
             for app_data in apps_data:
+                (app_id, name, description, space_id_value, created_date, modified_date,
+                 published, tags, thumbnail, usage) = _app_fields(app_data)
+                owner_data = app_data.get('owner') or {}
+                space_data = app_data.get('space') or {}
                 app_info = {
-                    'id': app_data.get('id', ''),
-                    'name': app_data.get('name', ''),
-                    'description': app_data.get('description', ''),
-                    'owner': app_data.get('owner', {}).get('name', '') if app_data.get('owner') else '',
-                    'owner_id': app_data.get('owner', {}).get('id', '') if app_data.get('owner') else '',
-                    'space_id': app_data.get('spaceId', ''),
-                    'space_name': app_data.get('space', {}).get('name', '') if app_data.get('space') else '',
-                    'created_date': app_data.get('createdDate', ''),
-                    'modified_date': app_data.get('modifiedDate', ''),
-                    'published': app_data.get('published', False),
-                    'tags': app_data.get('tags', []),
-                    'thumbnail': app_data.get('thumbnail', ''),
-                    'usage': app_data.get('usage', 'analytics')
+                    'id': app_id,
+                    'name': name,
+                    'description': description,
+                    'owner': owner_data.get('name', ''),
+                    'owner_id': owner_data.get('id', ''),
+                    'space_id': space_id_value,
+                    'space_name': space_data.get('name', ''),
+                    'created_date': created_date,
+                    'modified_date': modified_date,
+                    'published': published,
+                    'tags': tags,
+                    'thumbnail': thumbnail,
+                    'usage': usage
                 }
                 apps.append(app_info)
             
-            logger.info(f"Successfully listed {len(apps)} Qlik apps")
+            logger.info("Successfully listed %s Qlik apps", len(apps))
             
-            return {
-                'success': True,
-                'apps': apps,
-                'total_count': len(apps),
-                'filters_applied': {
-                    'space_id': space_id,
-                    'collection_id': collection_id,
-                    'owner': owner,
-                    'limit': limit,
-                    'offset': offset
-                },
-                'raw_output': result['stdout']
-            }
+            return self._app_list_response(apps, space_id, collection_id, owner, limit, offset)
             
         except Exception as e:
             error_msg = f"Failed to process app list output: {str(e)}"
             logger.error(error_msg)
             raise QlikCLIError(error_msg)
     
-    def app_get(self, app_identifier: str) -> Dict[str, Any]:
+    def _build_app_items_request(self,
+                                 space_id: Optional[str],
+                                 collection_id: Optional[str],
+                                 wanted: int) -> Tuple[str, Dict[str, Any]]:
+        """
+        Build the Qlik Cloud items API request equivalent to qlik app ls
+        (without an owner filter)
+        
+        Args:
+            wanted: Total number of items the caller will read (limit + offset)
+            
+        Returns:
+            Tuple of API path and query parameters for the first page
+        """
+        if collection_id:
+            path = f'/api/v1/collections/{collection_id}/items'
+        else:
+            path = '/api/v1/items'
+        
+        # The items API pages with cursors and at most 100 items per page
+        params: Dict[str, Any] = {'resourceType': 'app', 'limit': min(wanted, 100)}
+        if space_id:
+            params['spaceId'] = space_id
+        return path, params
+    
+    def _process_app_items(self,
+                           items: List[Dict[str, Any]],
+                           owner_names: Dict[str, str],
+                           space_names: Dict[str, str],
+                           space_id: Optional[str],
+                           collection_id: Optional[str],
+                           owner: Optional[str],
+                           limit: int,
+                           offset: int) -> Dict[str, Any]:
+        """
+        Structure Qlik Cloud items API results into the app_list result
+        
+        Items only carry owner and space IDs, so their names come from
+        owner_names and space_names (see _rest_lookup_names).
+        
+        Args:
+            items: Items of the requested page (the items API has no offset
+                parameter, so callers drop the first offset items)
+            owner_names: User ID -> name
+            space_names: Space ID -> name
+            
+        Returns:
+            Dictionary containing list of apps and metadata
+        """
+        apps = []
+        for item in items[:limit]:
+            get = item.get
+            attributes = get('resourceAttributes') or {}
+            owner_id = get('ownerId', '')
+            item_space_id = get('spaceId', '')
+            apps.append({
+                'id': get('resourceId', ''),
+                'name': get('name', ''),
+                'description': get('description', ''),
+                'owner': owner_names.get(owner_id, ''),
+                'owner_id': owner_id,
+                'space_id': item_space_id,
+                'space_name': space_names.get(item_space_id, ''),
+                'created_date': get('createdAt', ''),
+                'modified_date': get('updatedAt', ''),
+                'published': attributes.get('published', False),
+                'tags': _item_tags(item),
+                'thumbnail': attributes.get('thumbnail', ''),
+                'usage': attributes.get('usage', 'analytics')
+            })
+        
+        logger.info("Successfully listed %s Qlik apps via REST", len(apps))
+        
+        return self._app_list_response(apps, space_id, collection_id, owner, limit, offset)
+    
+    def _app_list_response(self,
+                           apps: List[Dict[str, Any]],
+                           space_id: Optional[str],
+                           collection_id: Optional[str],
+                           owner: Optional[str],
+                           limit: int,
+                           offset: int) -> Dict[str, Any]:
+        """Build the app_list result dictionary"""
+        return {
+            'success': True,
+            'apps': apps,
+            'total_count': len(apps),
+            'filters_applied': {
+                'space_id': space_id,
+                'collection_id': collection_id,
+                'owner': owner,
+                'limit': limit,
+                'offset': offset
+            }
+        }
+    
+    def app_get(self, app_identifier: str, include_raw: bool = False) -> Dict[str, Any]:
         """
         Get detailed information about a specific Qlik application
         
+        The result is cached briefly and invalidated by operations that
+        create or change apps.
+        
         Args:
             app_identifier: App ID or name to retrieve details for
+            include_raw: Also return the unparsed qlik-cli output as raw_output
             
         Returns:
             Dictionary containing detailed app information
@@ -123,18 +470,66 @@ class QlikAppDiscoveryMixin:
         Raises:
             QlikCLIError: If getting app details fails or app doesn't exist
         """
-        logger.info(f"Getting details for Qlik app: {app_identifier}")
-        
         # Validate app identifier
         if not app_identifier or not app_identifier.strip():
             raise QlikCLIError("App identifier cannot be empty")
         
+        # Cached like app_list, and dropped with it by invalidate_apps()
+        cache_key = ('app_get', self._base_cmd_prefix, app_identifier, include_raw)
+        # A copy, so callers cannot modify the cached details
+        return copy.deepcopy(self._cached(cache_key, _APP_LIST_TTL,
+                                          lambda: self._get_app(app_identifier, include_raw)))
+    
+    def app_get_many(self, app_identifiers: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get details for several Qlik applications at once
+        
+        qlik-cli has no batch or interactive mode, so each distinct app still
+        needs its own app get call; these run concurrently (at most
+        max_parallel_commands at a time) and cached results are reused.
+        
+        Args:
+            app_identifiers: App IDs or names (duplicates are looked up once)
+            
+        Returns:
+            Dictionary mapping each identifier to its app_get result, or to
+            {'success': False, 'error': ...} if that lookup failed
+        """
+        distinct_identifiers = list(dict.fromkeys(app_identifiers))
+        logger.info("Getting details for %s Qlik apps", len(distinct_identifiers))
+        
+        def get_app(app_identifier: str) -> Dict[str, Any]:
+            try:
+                return self.app_get(app_identifier)
+            except QlikCLIError as e:
+                return {'success': False, 'error': str(e)}
+        
+        if len(distinct_identifiers) <= 1:
+            return {app_identifier: get_app(app_identifier) for app_identifier in distinct_identifiers}
+        
+        max_workers = max(1, min(self.config.qlik.max_parallel_commands, len(distinct_identifiers)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(distinct_identifiers, executor.map(get_app, distinct_identifiers)))
+    
+    def _get_app(self, app_identifier: str, include_raw: bool) -> Dict[str, Any]:
+        """
+        Run qlik app get and structure its output
+        
+        Args:
+            app_identifier: App ID or name to retrieve details for
+            include_raw: Also return the unparsed qlik-cli output as raw_output
+            
+        Returns:
+            Dictionary containing detailed app information
+        """
+        logger.info("Getting details for Qlik app: %s", app_identifier)
+        
         # Build command
         cmd = self._build_base_command()
-        cmd.extend(['app', 'get', app_identifier, '--json'])
+        cmd += ('app', 'get', app_identifier, '--json')
         
         # Execute command
-        result = self._execute_command(cmd)
+        result = self._execute_command(cmd, binary_output=True)
         
         # Parse JSON output
         try:
@@ -144,63 +539,93 @@ class QlikAppDiscoveryMixin:
                 raise QlikCLIError(f"No app found with identifier: {app_identifier}")
             
             app_data = app_data_list[0]  # Get first (should be only) result
+            app_details = self._structure_app_details(app_data)
             
-            # Structure detailed app information
-            app_details = {
-                'id': app_data.get('id', ''),
-                'name': app_data.get('name', ''),
-                'description': app_data.get('description', ''),
-                'owner': {
-                    'id': app_data.get('owner', {}).get('id', '') if app_data.get('owner') else '',
-                    'name': app_data.get('owner', {}).get('name', '') if app_data.get('owner') else '',
-                    'email': app_data.get('owner', {}).get('email', '') if app_data.get('owner') else ''
-                },
-                'space': {
-                    'id': app_data.get('spaceId', ''),
-                    'name': app_data.get('space', {}).get('name', '') if app_data.get('space') else '',
-                    'type': app_data.get('space', {}).get('type', '') if app_data.get('space') else ''
-                },
-                'created_date': app_data.get('createdDate', ''),
-                'modified_date': app_data.get('modifiedDate', ''),
-                'published': app_data.get('published', False),
-                'tags': app_data.get('tags', []),
-                'thumbnail': app_data.get('thumbnail', ''),
-                'usage': app_data.get('usage', 'analytics'),
-                'file_size': app_data.get('fileSize', 0),
-                'last_reload_time': app_data.get('lastReloadTime', ''),
-                'has_data': app_data.get('hasData', False),
-                'is_direct_query_mode': app_data.get('isDirectQueryMode', False),
-                'encryption': app_data.get('encryption', {}),
-                'custom_properties': app_data.get('customProperties', []),
-                'origin_app_id': app_data.get('originAppId', ''),
-                'target_app_id': app_data.get('targetAppId', ''),
-                'attributes': app_data.get('attributes', [])
-            }
-            
-            logger.info(f"Successfully retrieved details for app: {app_identifier}")
+            logger.info("Successfully retrieved details for app: %s", app_identifier)
             
-            return {
+            app_result = {
                 'success': True,
-                'app': app_details,
-                'raw_output': result['stdout']
+                'app': app_details
             }
+            if include_raw:
+                app_result['raw_output'] = _decode_output(result['stdout'])
+            return app_result
             
         except Exception as e:
             error_msg = f"Failed to process app details for '{app_identifier}': {str(e)}"
             logger.error(error_msg)
             raise QlikCLIError(error_msg)
     
+    def _structure_app_details(self, app_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Structure a qlik app record into the app_get details format
+        
+        Args:
+            app_data: App record as printed by qlik-cli with --json
+            
+        Returns:
+            Dictionary containing detailed app information
+        """
+        (app_id, name, description, space_id, created_date, modified_date,
+         published, tags, thumbnail, usage) = _app_fields(app_data)
+        (file_size, last_reload_time, has_data, is_direct_query_mode, encryption,
+         custom_properties, origin_app_id, target_app_id, attributes) = _app_detail_fields(app_data)
+        owner_data = app_data.get('owner') or {}
+        space_data = app_data.get('space') or {}
+        
+        # Structure detailed app information
+        app_details = {
+            'id': app_id,
+            'name': name,
+            'description': description,
+            'owner': {
+                'id': owner_data.get('id', ''),
+                'name': owner_data.get('name', ''),
+                'email': owner_data.get('email', '')
+            },
+            'space': {
+                'id': space_id,
+                'name': space_data.get('name', ''),
+                'type': space_data.get('type', '')
+            },
+            'created_date': created_date,
+            'modified_date': modified_date,
+            'published': published,
+            'tags': tags,
+            'thumbnail': thumbnail,
+            'usage': usage,
+            'file_size': file_size,
+            'last_reload_time': last_reload_time,
+            'has_data': has_data,
+            'is_direct_query_mode': is_direct_query_mode,
+            'encryption': encryption,
+            'custom_properties': custom_properties,
+            'origin_app_id': origin_app_id,
+            'target_app_id': target_app_id,
+            'attributes': attributes
+        }
+        return app_details
+    
     def app_search(self, 
                    query: str,
                    limit: int = 20,
-                   filters: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+                   filters: Optional[Dict[str, str]] = None,
+                   mode: str = 'substring',
+                   apps: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
         """
         Search for Qlik applications by name or description
         
         Args:
-            query: Search query string
+            query: Search query string; in substring mode an app also matches
+                when a field contains all of the query's whitespace-separated
+                terms in any order
             limit: Maximum number of results to return (default: 20)
             filters: Additional filters (space_id, owner, etc.)
+            mode: 'substring' to match anywhere in name, description or tags
+                (default), or 'prefix' to only match app names starting with
+                the query (uses a sorted name index, e.g. for autocomplete)
+            apps: Apps from an earlier app_list call to search instead of
+                listing apps again
             
         Returns:
             Dictionary containing search results
@@ -208,75 +633,93 @@ class QlikAppDiscoveryMixin:
         Raises:
             QlikCLIError: If search fails
         """
-        logger.info(f"Searching Qlik apps with query: '{query}', limit: {limit}")
+        logger.info("Searching Qlik apps with query: '%s', limit: %s", query, limit)
         
         # Validate query
         if not query or not query.strip():
             raise QlikCLIError("Search query cannot be empty")
         
+        if mode not in ('substring', 'prefix'):
+            raise QlikCLIError(f"Invalid search mode: {mode}. Valid modes: substring, prefix")
+        
         # Get all apps first (we'll filter client-side since qlik-cli search may be limited)
         try:
-            # Get a larger set to search through
-            search_limit = max(limit * 5, 100)  # Get more apps to search through
-            all_apps_result = self.app_list(limit=search_limit)
-            all_apps = all_apps_result['apps']
+            if apps is not None:
+                all_apps = apps
+            else:
+                # Get a larger set to search through; a space filter is applied
+                # by qlik-cli so the whole set comes from that space
+                search_limit = max(limit * 5, 100)  # Get more apps to search through
+                space_id = filters.get('space_id') if filters else None
+                all_apps = self._get_cached_app_list(space_id or None, None, None, search_limit, 0, False)['apps']
             
-            # Perform client-side search
-            query_lower = query.lower()
-            matching_apps = []
+            # Additional filters, checked before an app's texts are searched
+            space_filter = filters.get('space_id') if filters else None
+            owner_filter = (filters.get('owner') or '').lower() if filters else ''
             
-            for app in all_apps:
-                # Search in name and description
-                name_match = query_lower in app.get('name', '').lower()
-                desc_match = query_lower in app.get('description', '').lower()
-                tag_match = any(query_lower in tag.lower() for tag in app.get('tags', []))
+            def passes_filters(app: Dict[str, Any]) -> bool:
+                return ((not space_filter or app.get('space_id') == space_filter)
+                        and (not owner_filter or owner_filter in app.get('owner', '').lower()))
+            
+            # Matches as (relevance score, match reason bits, app), generated
+            # lazily into nlargest; apps are only copied for the top results
+            if mode == 'prefix':
+                # Binary search the sorted name index for the prefix range
+                names, sorted_apps = self._get_app_name_index(all_apps)
+                prefix = query.casefold()
+                start = bisect_left(names, prefix)
+                end = bisect_left(names, prefix + '\U0010ffff')
+                matches = ((10, _NAME_MATCH, app) for app in sorted_apps[start:end]
+                           if passes_filters(app))
+            else:
+                # Perform client-side search on case-folded copies of the app
+                # texts, which are built once per (cached) app list
+                folded_query = query.casefold()
+                terms = _search_terms(folded_query)
                 
-                if name_match or desc_match or tag_match:
-                    # Calculate relevance score
-                    score = 0
-                    if name_match:
-                        score += 10
-                    if desc_match:
-                        score += 5
-                    if tag_match:
-                        score += 3
-                    
-                    app_with_score = app.copy()
-                    app_with_score['relevance_score'] = score
-                    app_with_score['match_reasons'] = []
-                    
-                    if name_match:
-                        app_with_score['match_reasons'].append('name')
-                    if desc_match:
-                        app_with_score['match_reasons'].append('description')
-                    if tag_match:
-                        app_with_score['match_reasons'].append('tags')
-                    
-                    matching_apps.append(app_with_score)
-            
-            # Apply additional filters if provided
-            if filters:
-                filtered_apps = []
-                for app in matching_apps:
-                    include_app = True
-                    
-                    if filters.get('space_id') and app.get('space_id') != filters['space_id']:
-                        include_app = False
-                    if filters.get('owner') and filters['owner'].lower() not in app.get('owner', '').lower():
-                        include_app = False
-                    
-                    if include_app:
-                        filtered_apps.append(app)
+                def matches_text(text: str) -> bool:
+                    # The whole query, or else every one of its terms
+                    return folded_query in text or (bool(terms) and all(term in text for term in terms))
                 
-                matching_apps = filtered_apps
-            
-            # Sort by relevance score (highest first)
-            matching_apps.sort(key=lambda x: x.get('relevance_score', 0), reverse=True)
+                def substring_matches() -> Iterator[Tuple[float, int, Dict[str, Any]]]:
+                    for app, (name_text, desc_text, tag_texts) in zip(all_apps, self._get_app_text_index(all_apps)):
+                        if not passes_filters(app):
+                            continue
+                        
+                        # Search in name and description
+                        name_match = matches_text(name_text)
+                        desc_match = matches_text(desc_text)
+                        matching_tags = [tag for tag in tag_texts if matches_text(tag)]
+                        tag_match = bool(matching_tags)
+                        
+                        if name_match or desc_match or tag_match:
+                            # Calculate relevance score; name and tag matches get a
+                            # bonus for how much of the text the query covers, so
+                            # 'code' ranks an app named 'Code' above 'Codes overview'
+                            score = 0
+                            if name_match:
+                                score += 10 + round(_NAME_COVERAGE_BONUS * _coverage(folded_query, name_text), 2)
+                            if desc_match:
+                                score += 5
+                            if tag_match:
+                                tag_coverage = max(_coverage(folded_query, tag) for tag in matching_tags)
+                                score += 3 + round(_TAG_COVERAGE_BONUS * tag_coverage, 2)
+                            
+                            reason_bits = name_match | desc_match << 1 | tag_match << 2
+                            yield score, reason_bits, app
+                
+                matches = substring_matches()
             
-            # Limit results
-            matching_apps = matching_apps[:limit]
+            # Keep the best results (highest score first, ties in listing
+            # order); nlargest avoids sorting every match for small limits
+            matching_apps = []
+            for score, reason_bits, app in heapq.nlargest(limit, matches, key=itemgetter(0)):
+                app_with_score = app.copy()
+                app_with_score['relevance_score'] = score
+                app_with_score['match_reasons'] = list(_MATCH_REASONS[reason_bits])
+                matching_apps.append(app_with_score)
             
-            logger.info(f"Found {len(matching_apps)} matching apps for query: '{query}'")
+            logger.info("Found %s matching apps for query: '%s'", len(matching_apps), query)
             
             return {
                 'success': True,
@@ -290,4 +733,44 @@ class QlikAppDiscoveryMixin:
         except Exception as e:
             error_msg = f"Failed to search apps with query '{query}': {str(e)}"
             logger.error(error_msg)
-            raise QlikCLIError(error_msg)
\ No newline at end of file
+            raise QlikCLIError(error_msg)
+    
+    def _get_app_text_index(self, apps: List[Dict[str, Any]]) -> List[Tuple[str, str, Tuple[str, ...]]]:
+        """
+        Get case-folded name, description and tags of each app for substring
+        search, reusing them while the (cached) app list is unchanged
+        
+        Args:
+            apps: Apps as returned by app_list
+            
+        Returns:
+            List of (name, description, tags) tuples in the order of apps
+        """
+        index = self._app_text_index
+        if index is None or index[0] is not apps:
+            texts = [(app.get('name', '').casefold(),
+                      app.get('description', '').casefold(),
+                      tuple(tag.casefold() for tag in app.get('tags', [])))
+                     for app in apps]
+            index = (apps, texts)
+            self._app_text_index = index
+        return index[1]
+    
+    def _get_app_name_index(self, apps: List[Dict[str, Any]]) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """
+        Get apps sorted by case-folded name, reusing the index while the
+        (cached) app list is unchanged
+        
+        Args:
+            apps: Apps as returned by app_list
+            
+        Returns:
+            Tuple of (sorted case-folded names, apps in the same order)
+        """
+        index = self._app_name_index
+        if index is None or index[0] is not apps:
+            sorted_apps = sorted(apps, key=lambda app: app.get('name', '').casefold())
+            names = [app.get('name', '').casefold() for app in sorted_apps]
+            index = (apps, names, sorted_apps)
+            self._app_name_index = index
+        return index[1], index[2]
@@ -8,14 +8,28 @@ export, import, copy, and publish operations.
 import logging
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any, Union
 from pathlib import Path
 
-from .qlik_cli_base import QlikCLI, QlikCLIError
+from .qlik_cli_base import QlikCLI, QlikCLIError, _invalidate_path_cache
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Ways qlik-cli may report the ID of an imported app (format may vary),
+# combined so the output is scanned once; group N holds the ID of pattern N
+_IMPORTED_APP_ID_RE = re.compile(
+    r'App ID:\s*([a-f0-9-]+)'
+    r'|Created app:\s*([a-f0-9-]+)'
+    r'|app\s+([a-f0-9-]+)\s+created'
+    r'|"id":\s*"([a-f0-9-]+)"',
+    re.IGNORECASE
+)
+
+# Shape of an app ID in qlik-cli output (a GUID)
+_APP_ID_RE = re.compile(r'[a-f0-9]{8}(?:-[a-f0-9]{4}){3}-[a-f0-9]{12}', re.IGNORECASE)
+
 
 class QlikAppLifecycleMixin:
     """Mixin class for app lifecycle operations"""
@@ -25,7 +39,8 @@ class QlikAppLifecycleMixin:
                    output_path: str,
                    format: str = 'qvf',
                    include_data: bool = True,
-                   no_data: bool = False) -> Dict[str, Any]:
+                   no_data: bool = False,
+                   verify_exists: bool = True) -> Dict[str, Any]:
         """
         Export Qlik application to local file for backup, migration, or version control
         
@@ -35,6 +50,9 @@ class QlikAppLifecycleMixin:
             format: Export format ('qvf', 'json', 'xlsx')
             include_data: Whether to include data in export (default: True)
             no_data: Export without data (only metadata/script) (default: False)
+            verify_exists: Look the app up before exporting (default: True);
+                bulk exports can skip it, since the export itself fails for
+                unknown apps
             
         Returns:
             Dictionary containing export result and file information
@@ -42,7 +60,7 @@ class QlikAppLifecycleMixin:
         Raises:
             QlikCLIError: If export fails or parameters are invalid
         """
-        logger.info(f"Exporting Qlik app '{app_identifier}' to '{output_path}' in format '{format}'")
+        logger.info("Exporting Qlik app '%s' to '%s' in format '%s'", app_identifier, output_path, format)
         
         # Validate parameters
         if not app_identifier or not app_identifier.strip():
@@ -53,6 +71,7 @@ class QlikAppLifecycleMixin:
         
         if not self._validate_export_format(format):
             raise QlikCLIError(f"Invalid export format: {format}. Valid formats: qvf, json, xlsx")
+        format = format.lower()
         
         # Handle conflicting data parameters
         if no_data and include_data:
@@ -73,26 +92,21 @@ class QlikAppLifecycleMixin:
             raise QlikCLIError(f"Insufficient disk space. Available: {available_space / (1024*1024):.1f}MB")
         
         # Validate app exists before attempting export
-        try:
-            app_details = self.app_get(app_identifier)
-            if not app_details['success']:
-                raise QlikCLIError(f"App '{app_identifier}' not found or not accessible")
-        except QlikCLIError as e:
-            raise QlikCLIError(f"Cannot validate app before export: {str(e)}")
+        if verify_exists:
+            try:
+                app_details = self.app_get(app_identifier)
+                if not app_details['success']:
+                    raise QlikCLIError(f"App '{app_identifier}' not found or not accessible")
+            except QlikCLIError as e:
+                raise QlikCLIError(f"Cannot validate app before export: {str(e)}")
         
         # Build export command
         cmd = self._build_base_command()
-        cmd.extend(['app', 'export'])
-        
-        # Add app identifier
-        cmd.extend(['--app', app_identifier])
-        
-        # Add output path
-        cmd.extend(['--output', str(output_path)])
+        cmd += ('app', 'export', '--app', app_identifier, '--output', str(output_path))
         
         # Add format if not default qvf
-        if format.lower() != 'qvf':
-            cmd.extend(['--format', format.lower()])
+        if format != 'qvf':
+            cmd += ('--format', format)
         
         # Add data options
         if no_data or not include_data:
@@ -103,8 +117,10 @@ class QlikAppLifecycleMixin:
         temp_files = []
         
         try:
-            # Execute export command
-            result = self._execute_command(cmd)
+            # Execute export command (its progress output can be large)
+            result = self._execute_command(cmd, spool_output=True)
+            # qlik-cli wrote (or replaced) the output file
+            _invalidate_path_cache(str(output_path))
             
             # Calculate duration
             duration = time.time() - start_time
@@ -116,13 +132,13 @@ class QlikAppLifecycleMixin:
             # Get file size
             file_size = output_file.stat().st_size
             
-            logger.info(f"Successfully exported app '{app_identifier}' to '{output_path}' ({file_size} bytes, {duration:.2f}s)")
+            logger.info("Successfully exported app '%s' to '%s' (%s bytes, %.2fs)", app_identifier, output_path, file_size, duration)
             
             return {
                 'success': True,
                 'app_identifier': app_identifier,
                 'output_path': str(output_path),
-                'format': format.lower(),
+                'format': format,
                 'file_size_bytes': file_size,
                 'file_size_mb': round(file_size / (1024 * 1024), 2),
                 'include_data': include_data and not no_data,
@@ -135,9 +151,9 @@ class QlikAppLifecycleMixin:
             if output_file.exists():
                 try:
                     output_file.unlink()
-                    logger.info(f"Cleaned up partial export file: {output_path}")
+                    logger.info("Cleaned up partial export file: %s", output_path)
                 except Exception as cleanup_error:
-                    logger.warning(f"Failed to clean up partial file {output_path}: {cleanup_error}")
+                    logger.warning("Failed to clean up partial file %s: %s", output_path, cleanup_error)
             
             error_msg = f"Failed to export app '{app_identifier}': {str(e)}"
             logger.error(error_msg)
@@ -169,7 +185,8 @@ class QlikAppLifecycleMixin:
                    app_name: Optional[str] = None,
                    space_id: Optional[str] = None,
                    replace_existing: bool = False,
-                   validate_before_import: bool = True) -> Dict[str, Any]:
+                   validate_before_import: bool = True,
+                   verify: bool = True) -> Dict[str, Any]:
         """
         Import Qlik application from local file to create new app in tenant
         
@@ -179,6 +196,8 @@ class QlikAppLifecycleMixin:
             space_id: Target space for import (optional, uses personal space if not provided)
             replace_existing: Whether to replace existing app with same name
             validate_before_import: Whether to validate file before import
+            verify: Whether to look the imported app up afterwards when the
+                import output does not describe it (default: True)
             
         Returns:
             Dictionary containing import result and new app information
@@ -186,7 +205,7 @@ class QlikAppLifecycleMixin:
         Raises:
             QlikCLIError: If import fails or parameters are invalid
         """
-        logger.info(f"Importing Qlik app from '{file_path}' with name '{app_name}'")
+        logger.info("Importing Qlik app from '%s' with name '%s'", file_path, app_name)
         
         # Validate file path
         if not file_path or not file_path.strip():
@@ -209,11 +228,11 @@ class QlikAppLifecycleMixin:
             
             # Check file extension
             if not import_file.suffix.lower() in ['.qvf', '.json']:
-                logger.warning(f"Unexpected file extension: {import_file.suffix}. Proceeding anyway.")
+                logger.warning("Unexpected file extension: %s. Proceeding anyway.", import_file.suffix)
             
             # Check if file is too large (>2GB warning)
             if file_size > 2 * 1024 * 1024 * 1024:
-                logger.warning(f"Large file detected ({file_size / (1024*1024*1024):.1f}GB). Import may take a long time.")
+                logger.warning("Large file detected (%.1fGB). Import may take a long time.", file_size / (1024*1024*1024))
         
         # Generate app name if not provided
         if not app_name:
@@ -223,50 +242,42 @@ class QlikAppLifecycleMixin:
         if not app_name or not app_name.strip():
             raise QlikCLIError("App name cannot be empty")
         
-        # Validate space if provided
-        if space_id:
-            try:
-                spaces_result = self.space_list()
-                available_spaces = [space['id'] for space in spaces_result['spaces']]
-                if space_id not in available_spaces:
-                    raise QlikCLIError(f"Space '{space_id}' not found or not accessible")
-            except QlikCLIError as e:
-                raise QlikCLIError(f"Cannot validate target space: {str(e)}")
-        
-        # Check for existing app with same name if not replacing
-        if not replace_existing:
-            try:
-                search_result = self.app_search(app_name, limit=10)
-                existing_apps = [app for app in search_result['apps'] 
-                               if app['name'].lower() == app_name.lower()]
-                
-                if existing_apps:
-                    # Filter by space if specified
-                    if space_id:
-                        existing_apps = [app for app in existing_apps if app['space_id'] == space_id]
-                    
-                    if existing_apps:
-                        raise QlikCLIError(f"App with name '{app_name}' already exists. Use replace_existing=True to overwrite.")
+        # The space check and the duplicate-name search are independent
+        # qlik-cli round trips, so the search runs on a worker thread meanwhile
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            existing_future = None
+            if not replace_existing:
+                existing_future = executor.submit(self._find_existing_app, app_name, space_id)
             
-            except QlikCLIError as e:
-                if "already exists" in str(e):
-                    raise e
-                # If search fails for other reasons, continue with import
-                logger.warning(f"Could not check for existing apps: {str(e)}")
+            # Validate space if provided
+            if space_id:
+                try:
+                    spaces_result = self.space_list()
+                    available_spaces = [space['id'] for space in spaces_result['spaces']]
+                    if space_id not in available_spaces:
+                        raise QlikCLIError(f"Space '{space_id}' not found or not accessible")
+                except QlikCLIError as e:
+                    raise QlikCLIError(f"Cannot validate target space: {str(e)}")
+            
+            # Check for existing app with same name if not replacing
+            if existing_future is not None:
+                try:
+                    existing_app = existing_future.result()
+                except QlikCLIError as e:
+                    # If search fails, continue with import
+                    logger.warning("Could not check for existing apps: %s", e)
+                    existing_app = None
+                
+                if existing_app is not None:
+                    raise QlikCLIError(f"App with name '{app_name}' already exists. Use replace_existing=True to overwrite.")
         
         # Build import command
         cmd = self._build_base_command()
-        cmd.extend(['app', 'import'])
-        
-        # Add file path
-        cmd.extend(['--file', str(file_path)])
-        
-        # Add app name
-        cmd.extend(['--name', app_name])
+        cmd += ('app', 'import', '--file', str(file_path), '--name', app_name, '--json')
         
         # Add space if specified
         if space_id:
-            cmd.extend(['--space', space_id])
+            cmd += ('--space', space_id)
         
         # Add replace flag if specified
         if replace_existing:
@@ -276,51 +287,52 @@ class QlikAppLifecycleMixin:
         start_time = time.time()
         
         try:
-            # Execute import command
+            # Execute import command; not spooled, since its --json output is
+            # parsed in full (and --json turns off verbose progress output)
             result = self._execute_command(cmd)
+            self.invalidate_apps()
             
             # Calculate duration
             duration = time.time() - start_time
             
             # Try to get the new app ID from output
             new_app_id = None
+            verification_result = None
             if result['stdout']:
-                # Look for app ID in output (format may vary)
                 import_output = result['stdout']
-                # Try to extract app ID using common patterns
-                id_patterns = [
-                    r'App ID:\s*([a-f0-9-]+)',
-                    r'Created app:\s*([a-f0-9-]+)',
-                    r'app\s+([a-f0-9-]+)\s+created',
-                    r'"id":\s*"([a-f0-9-]+)"'
-                ]
-                
-                for pattern in id_patterns:
-                    match = re.search(pattern, import_output, re.IGNORECASE)
+                # With --json qlik-cli prints the created app, which already
+                # verifies the import without another qlik-cli call
+                imported_app = self._imported_app_details(import_output, app_name)
+                if imported_app:
+                    new_app_id = imported_app['id']
+                    verification_result = {'success': True, 'app': imported_app}
+                else:
+                    # Look for app ID in output (format may vary), using the
+                    # common patterns in one pass
+                    match = _IMPORTED_APP_ID_RE.search(import_output)
                     if match:
-                        new_app_id = match.group(1)
-                        break
+                        new_app_id = match.group(match.lastindex)
             
-            # Verify import by searching for the app
-            verification_result = None
-            if new_app_id:
-                try:
-                    verification_result = self.app_get(new_app_id)
-                except Exception:
-                    logger.warning(f"Could not verify imported app with ID: {new_app_id}")
-            else:
-                # Try to find by name
-                try:
-                    search_result = self.app_search(app_name, limit=5)
-                    matching_apps = [app for app in search_result['apps'] 
-                                   if app['name'] == app_name]
-                    if matching_apps:
-                        new_app_id = matching_apps[0]['id']
+            # Verify import by looking the app up, unless the output already did
+            if verification_result is None and verify:
+                if new_app_id:
+                    try:
                         verification_result = self.app_get(new_app_id)
-                except Exception:
-                    logger.warning(f"Could not verify imported app by name: {app_name}")
-            
-            logger.info(f"Successfully imported app '{app_name}' from '{file_path}' (ID: {new_app_id}, {duration:.2f}s)")
+                    except Exception:
+                        logger.warning("Could not verify imported app with ID: %s", new_app_id)
+                else:
+                    # Try to find by name
+                    try:
+                        search_result = self.app_search(app_name, limit=5)
+                        matching_apps = [app for app in search_result['apps'] 
+                                       if app['name'] == app_name]
+                        if matching_apps:
+                            new_app_id = matching_apps[0]['id']
+                            verification_result = self.app_get(new_app_id)
+                    except Exception:
+                        logger.warning("Could not verify imported app by name: %s", app_name)
+            
+            logger.info("Successfully imported app '%s' from '%s' (ID: %s, %.2fs)", app_name, file_path, new_app_id, duration)
             
             return {
                 'success': True,
@@ -344,6 +356,61 @@ class QlikAppLifecycleMixin:
             logger.error(error_msg)
             raise QlikCLIError(error_msg)
     
+    def _imported_app_details(self, import_output: str, app_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Read the created app from qlik app import --json output
+        
+        Only a record shaped like the imported app counts: its ID must look
+        like an app ID and its name must be app_name.
+        
+        Args:
+            import_output: Output of the import command
+            app_name: Name the app was imported under
+            
+        Returns:
+            App details in the app_get format, or None if the output does not
+            contain a matching app record
+        """
+        try:
+            records = self._parse_json_output(import_output)
+        except QlikCLIError:
+            return None
+        
+        for app_data in records:
+            if not isinstance(app_data, dict):
+                continue
+            # Apps may be printed with their properties under 'attributes'
+            if not app_data.get('id') and isinstance(app_data.get('attributes'), dict):
+                app_data = app_data['attributes']
+            app_id = app_data.get('id')
+            if (isinstance(app_id, str) and _APP_ID_RE.fullmatch(app_id)
+                    and app_data.get('name') == app_name):
+                return self._structure_app_details(app_data)
+        return None
+    
+    def _find_existing_app(self, app_name: str, space_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        """
+        Find an app with the given name (case-insensitive), optionally in one space
+        
+        Args:
+            app_name: App name to look for
+            space_id: Only consider apps in this space
+            
+        Returns:
+            The first matching app, or None
+            
+        Raises:
+            QlikCLIError: If searching apps fails
+        """
+        # A target space is passed on to qlik-cli (app ls --space), so
+        # only apps in that space are listed and searched
+        search_filters = {'space_id': space_id} if space_id else None
+        search_result = self.app_search(app_name, limit=10, filters=search_filters)
+        folded_name = app_name.casefold()
+        return next((app for app in search_result['apps']
+                     if app['name'].casefold() == folded_name
+                     and (not space_id or app['space_id'] == space_id)), None)
+    
     def app_copy(self,
                  source_app_id: str,
                  target_name: str,
@@ -366,7 +433,7 @@ class QlikAppLifecycleMixin:
         Raises:
             QlikCLIError: If copy fails or parameters are invalid
         """
-        logger.info(f"Copying Qlik app '{source_app_id}' to new app '{target_name}'")
+        logger.info("Copying Qlik app '%s' to new app '%s'", source_app_id, target_name)
         
         # Validate parameters
         if not source_app_id or not source_app_id.strip():
@@ -382,7 +449,7 @@ class QlikAppLifecycleMixin:
                 raise QlikCLIError(f"Source app '{source_app_id}' not found or not accessible")
             
             source_app = source_app_details['app']
-            logger.info(f"Source app found: '{source_app['name']}' in space '{source_app['space']['name']}'")
+            logger.info("Source app found: '%s' in space '%s'", source_app['name'], source_app['space']['name'])
             
         except QlikCLIError as e:
             raise QlikCLIError(f"Cannot validate source app: {str(e)}")
@@ -390,7 +457,7 @@ class QlikAppLifecycleMixin:
         # Use source app space if target space not specified
         if not target_space_id:
             target_space_id = source_app['space']['id']
-            logger.info(f"Using source app space as target: {target_space_id}")
+            logger.info("Using source app space as target: %s", target_space_id)
         
         # Validate target space if specified
         if target_space_id:
@@ -418,7 +485,7 @@ class QlikAppLifecycleMixin:
             if "already exists" in str(e):
                 raise e
             # If search fails for other reasons, continue with copy
-            logger.warning(f"Could not check for existing apps: {str(e)}")
+            logger.warning("Could not check for existing apps: %s", e)
         
         # Build copy command
         cmd = self._build_base_command()
@@ -448,6 +515,7 @@ class QlikAppLifecycleMixin:
         try:
             # Execute copy command
             result = self._execute_command(cmd)
+            self.invalidate_apps()
             
             # Calculate duration
             duration = time.time() - start_time
@@ -477,7 +545,7 @@ class QlikAppLifecycleMixin:
                 try:
                     verification_result = self.app_get(new_app_id)
                 except Exception:
-                    logger.warning(f"Could not verify copied app with ID: {new_app_id}")
+                    logger.warning("Could not verify copied app with ID: %s", new_app_id)
             else:
                 # Try to find by name in target space
                 try:
@@ -488,9 +556,9 @@ class QlikAppLifecycleMixin:
                         new_app_id = matching_apps[0]['id']
                         verification_result = self.app_get(new_app_id)
                 except Exception:
-                    logger.warning(f"Could not verify copied app by name: {target_name}")
+                    logger.warning("Could not verify copied app by name: %s", target_name)
             
-            logger.info(f"Successfully copied app '{source_app_id}' to '{target_name}' (ID: {new_app_id}, {duration:.2f}s)")
+            logger.info("Successfully copied app '%s' to '%s' (ID: %s, %.2fs)", source_app_id, target_name, new_app_id, duration)
             
             return {
                 'success': True,
@@ -536,7 +604,7 @@ class QlikAppLifecycleMixin:
         Raises:
             QlikCLIError: If publication fails or parameters are invalid
         """
-        logger.info(f"Publishing Qlik app '{app_id}' to managed space '{target_space_id}'")
+        logger.info("Publishing Qlik app '%s' to managed space '%s'", app_id, target_space_id)
         
         # Validate parameters
         if not app_id or not app_id.strip():
@@ -552,7 +620,7 @@ class QlikAppLifecycleMixin:
                 raise QlikCLIError(f"App '{app_id}' not found or not accessible")
             
             source_app = source_app_details['app']
-            logger.info(f"Source app found: '{source_app['name']}' in space '{source_app['space']['name']}'")
+            logger.info("Source app found: '%s' in space '%s'", source_app['name'], source_app['space']['name'])
             
         except QlikCLIError as e:
             raise QlikCLIError(f"Cannot validate source app: {str(e)}")
@@ -560,7 +628,7 @@ class QlikAppLifecycleMixin:
         # Use source app name if publish name not specified
         if not publish_name:
             publish_name = source_app['name']
-            logger.info(f"Using source app name for publication: {publish_name}")
+            logger.info("Using source app name for publication: %s", publish_name)
         
         # Validate target space exists and is managed
         try:
@@ -575,7 +643,7 @@ class QlikAppLifecycleMixin:
                 raise QlikCLIError(f"Target space '{target_space_id}' not found")
             
             if target_space['type'].lower() != 'managed':
-                logger.warning(f"Target space '{target_space['name']}' is not a managed space (type: {target_space['type']})")
+                logger.warning("Target space '%s' is not a managed space (type: %s)", target_space['name'], target_space['type'])
             
         except QlikCLIError as e:
             raise QlikCLIError(f"Cannot validate target space: {str(e)}")
@@ -595,7 +663,7 @@ class QlikAppLifecycleMixin:
                 if "already exists" in str(e):
                     raise e
                 # If search fails for other reasons, continue with publication
-                logger.warning(f"Could not check for existing published apps: {str(e)}")
+                logger.warning("Could not check for existing published apps: %s", e)
         
         # Build publish command
         cmd = self._build_base_command()
@@ -621,6 +689,7 @@ class QlikAppLifecycleMixin:
         try:
             # Execute publish command
             result = self._execute_command(cmd)
+            self.invalidate_apps()
             
             # Calculate duration
             duration = time.time() - start_time
@@ -650,7 +719,7 @@ class QlikAppLifecycleMixin:
                 try:
                     verification_result = self.app_get(published_app_id)
                 except Exception:
-                    logger.warning(f"Could not verify published app with ID: {published_app_id}")
+                    logger.warning("Could not verify published app with ID: %s", published_app_id)
             else:
                 # Try to find by name in target space
                 try:
@@ -661,9 +730,9 @@ class QlikAppLifecycleMixin:
                         published_app_id = matching_apps[0]['id']
                         verification_result = self.app_get(published_app_id)
                 except Exception:
-                    logger.warning(f"Could not verify published app by name: {publish_name}")
+                    logger.warning("Could not verify published app by name: %s", publish_name)
             
-            logger.info(f"Successfully published app '{app_id}' to space '{target_space_id}' (Published ID: {published_app_id}, {duration:.2f}s)")
+            logger.info("Successfully published app '%s' to space '%s' (Published ID: %s, %.2fs)", app_id, target_space_id, published_app_id, duration)
             
             return {
                 'success': True,
@@ -4,19 +4,24 @@ Qlik Context Management Tools
 This module provides methods for context management operations.
 """
 
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any
 
-from .qlik_cli_base import QlikCLI, QlikCLIError
+from .qlik_cli_base import QlikCLI, QlikCLIError, _CONTEXT_LIST_TTL
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+_API_KEY_REJECTED = "API key validation failed - unable to authenticate with the provided credentials"
+
 
 class QlikContextManagementMixin:
     """Mixin class for context management operations"""
     
-    def context_create(self, name: str, tenant_url: str, api_key: str) -> Dict[str, Any]:
+    def context_create(self, name: str, tenant_url: str, api_key: str,
+                       validate: bool = False) -> Dict[str, Any]:
         """
         Create a new Qlik context with API key authentication
         
@@ -24,6 +29,65 @@ class QlikContextManagementMixin:
             name: Name for the new context
             tenant_url: Qlik Cloud tenant URL
             api_key: API key for authentication
+            validate: Whether to validate the API key against the tenant (costs
+                an extra qlik-cli call, run while the context is created; the
+                context is removed again if the key is rejected, default: False)
+            
+        Returns:
+            Dictionary containing operation result
+            
+        Raises:
+            QlikCLIError: If context creation fails or parameters are invalid
+        """
+        logger.info("Creating Qlik context: %s", name)
+        
+        # Validate parameters and build command
+        cmd = self._build_context_create_command(name, tenant_url, api_key)
+        
+        # Optionally validate API key against tenant; malformed and recently
+        # checked keys are answered without qlik-cli
+        known_valid = self._known_api_key_validity(api_key, tenant_url) if validate else True
+        if known_valid is False:
+            raise QlikCLIError(_API_KEY_REJECTED)
+        
+        if known_valid:
+            # Execute command with sensitive data masking
+            result = self._execute_command(cmd, mask_sensitive=True)
+            self._invalidate_cache(self._context_list_cache_key())
+        else:
+            # Validate the API key against the tenant while the context is
+            # created; the context is removed again if the key is rejected
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                validation = executor.submit(self.validate_api_key, api_key, tenant_url)
+                try:
+                    result = self._execute_command(cmd, mask_sensitive=True)
+                except QlikCLIError:
+                    if not validation.result():
+                        raise QlikCLIError(_API_KEY_REJECTED)
+                    raise
+                finally:
+                    self._invalidate_cache(self._context_list_cache_key())
+                if not validation.result():
+                    self._rollback_context_create(name)
+                    raise QlikCLIError(_API_KEY_REJECTED)
+        
+        logger.info("Successfully created Qlik context: %s", name)
+        return result
+    
+    async def context_create_async(self, name: str, tenant_url: str, api_key: str,
+                                   validate: bool = False) -> Dict[str, Any]:
+        """
+        Create a new Qlik context without blocking the event loop
+        
+        Several contexts can be created (and their API keys validated)
+        concurrently by awaiting multiple calls with asyncio.gather.
+        
+        Args:
+            name: Name for the new context
+            tenant_url: Qlik Cloud tenant URL
+            api_key: API key for authentication
+            validate: Whether to validate the API key against the tenant, while
+                the context is created as in context_create (default: False)
             
         Returns:
             Dictionary containing operation result
@@ -31,8 +95,65 @@ class QlikContextManagementMixin:
         Raises:
             QlikCLIError: If context creation fails or parameters are invalid
         """
-        logger.info(f"Creating Qlik context: {name}")
+        logger.info("Creating Qlik context (async): %s", name)
+        
+        cmd = self._build_context_create_command(name, tenant_url, api_key)
+        
+        known_valid = self._known_api_key_validity(api_key, tenant_url) if validate else True
+        if known_valid is False:
+            raise QlikCLIError(_API_KEY_REJECTED)
+        
+        if known_valid:
+            result = await self._execute_command_async(cmd, mask_sensitive=True)
+            self._invalidate_cache(self._context_list_cache_key())
+        else:
+            # Validate the API key while the context is created, as in context_create
+            valid, result = await asyncio.gather(
+                self.validate_api_key_async(api_key, tenant_url),
+                self._execute_command_async(cmd, mask_sensitive=True),
+                return_exceptions=True
+            )
+            self._invalidate_cache(self._context_list_cache_key())
+            if valid is not True:
+                if not isinstance(result, BaseException):
+                    self._rollback_context_create(name)
+                if isinstance(valid, BaseException):
+                    raise valid
+                raise QlikCLIError(_API_KEY_REJECTED)
+            if isinstance(result, BaseException):
+                raise result
+        
+        logger.info("Successfully created Qlik context: %s", name)
+        return result
+    
+    def _rollback_context_create(self, name: str) -> None:
+        """
+        Remove a context created with an API key that failed validation
+        
+        Args:
+            name: Name of the created context
+        """
+        try:
+            self._execute_command([self.cli_path, 'context', 'rm', name])
+        except QlikCLIError as e:
+            logger.warning("Could not remove context '%s' after failed API key validation: %s", name, e)
+        self._invalidate_cache(self._context_list_cache_key())
+    
+    def _build_context_create_command(self, name: str, tenant_url: str, api_key: str) -> List[str]:
+        """
+        Validate context parameters and build the context create command
         
+        Args:
+            name: Name for the new context
+            tenant_url: Qlik Cloud tenant URL
+            api_key: API key for authentication
+            
+        Returns:
+            List of command components
+            
+        Raises:
+            QlikCLIError: If parameters are invalid
+        """
         # Validate parameters
         if not name or not name.strip():
             raise QlikCLIError("Context name cannot be empty")
@@ -43,32 +164,39 @@ class QlikContextManagementMixin:
         if not api_key or len(api_key.strip()) < 10:
             raise QlikCLIError("API key appears to be invalid (too short)")
         
-        # Validate API key against tenant before creating context
-        if not self.validate_api_key(api_key, tenant_url):
-            raise QlikCLIError("API key validation failed - unable to authenticate with the provided credentials")
-        
         # Build command
         cmd = [self.cli_path, 'context', 'create']
         cmd.extend(['--name', name])
         cmd.extend(['--server', tenant_url])
         cmd.extend(['--api-key', api_key])
-        
-        # Execute command with sensitive data masking
-        result = self._execute_command(cmd, mask_sensitive=True)
-        
-        logger.info(f"Successfully created Qlik context: {name}")
-        return result
+        return cmd
     
     def context_list(self) -> Dict[str, Any]:
         """
         List all available Qlik contexts
         
+        The result is cached briefly and invalidated by context_create,
+        context_use and context_remove.
+        
         Returns:
             Dictionary containing list of contexts and current active context
             
         Raises:
             QlikCLIError: If listing contexts fails
         """
+        return self._cached(self._context_list_cache_key(), _CONTEXT_LIST_TTL, self._list_contexts)
+    
+    def _context_list_cache_key(self) -> tuple:
+        """Cache key for context_list results"""
+        return ('context_list', self.cli_path)
+    
+    def _list_contexts(self) -> Dict[str, Any]:
+        """
+        Run qlik context ls and parse its output
+        
+        Returns:
+            Dictionary containing list of contexts and current active context
+        """
         logger.info("Listing Qlik contexts")
         
         # Build command
@@ -82,25 +210,29 @@ class QlikContextManagementMixin:
         current_context = None
         
         if result['stdout']:
-            lines = result['stdout'].strip().split('\n')
-            for line in lines:
-                line = line.strip()
-                if line and not line.startswith('NAME'):  # Skip header
-                    # Parse context line (format may vary)
-                    parts = line.split()
-                    if parts:
-                        context_name = parts[0]
-                        is_current = '*' in line or 'current' in line.lower()
-                        
-                        contexts.append({
-                            'name': context_name,
-                            'is_current': is_current
-                        })
-                        
-                        if is_current:
-                            current_context = context_name
-        
-        logger.info(f"Found {len(contexts)} Qlik contexts")
+            # Lowercase the output once for the 'current' marker check
+            # (lower() keeps line breaks, so the lines stay aligned)
+            lines = result['stdout'].splitlines()
+            lowered_lines = result['stdout'].lower().splitlines()
+            for line, lowered_line in zip(lines, lowered_lines):
+                # Only the first column is needed; skip blank lines and the header
+                parts = line.split(None, 1)
+                if not parts or parts[0].startswith('NAME'):
+                    continue
+
+                # Parse context line (format may vary)
+                context_name = parts[0]
+                is_current = '*' in line or 'current' in lowered_line
+
+                contexts.append({
+                    'name': context_name,
+                    'is_current': is_current
+                })
+
+                if is_current:
+                    current_context = context_name
+        
+        logger.info("Found %s Qlik contexts", len(contexts))
         
         return {
             'success': True,
@@ -109,12 +241,15 @@ class QlikContextManagementMixin:
             'raw_output': result['stdout']
         }
     
-    def context_use(self, name: str) -> Dict[str, Any]:
+    def context_use(self, name: str,
+                    contexts_snapshot: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Switch to a specific Qlik context
         
         Args:
             name: Name of the context to activate
+            contexts_snapshot: Result of an earlier context_list() call to check
+                against instead of listing contexts again (for batch callers)
             
         Returns:
             Dictionary containing operation result
@@ -122,34 +257,57 @@ class QlikContextManagementMixin:
         Raises:
             QlikCLIError: If context switching fails or context doesn't exist
         """
-        logger.info(f"Switching to Qlik context: {name}")
+        logger.info("Switching to Qlik context: %s", name)
         
         # Validate context name
         if not name or not name.strip():
             raise QlikCLIError("Context name cannot be empty")
         
-        # Check if context exists
-        contexts_result = self.context_list()
-        available_contexts = [ctx['name'] for ctx in contexts_result['contexts']]
+        # Check if context exists; without a snapshot, list contexts afresh
+        # since the active context may have been switched outside this process
+        if not contexts_snapshot:
+            self._invalidate_cache(self._context_list_cache_key())
+        contexts_result = contexts_snapshot or self.context_list()
+        contexts_by_name = self._get_context_index(contexts_result)
+        
+        if name not in contexts_by_name:
+            raise QlikCLIError(f"Context '{name}' not found. Available contexts: {', '.join(contexts_by_name)}")
         
-        if name not in available_contexts:
-            raise QlikCLIError(f"Context '{name}' not found. Available contexts: {', '.join(available_contexts)}")
+        # Nothing to do if the freshly listed active context is the requested
+        # one (a caller's snapshot may be stale, so then always switch)
+        if not contexts_snapshot and contexts_result['current_context'] == name:
+            logger.info("Qlik context already active: %s", name)
+            return {
+                'success': True,
+                'returncode': 0,
+                'stdout': '',
+                'stderr': '',
+                'command': '',
+                'cached': True
+            }
         
         # Build command
         cmd = [self.cli_path, 'context', 'use', name]
         
         # Execute command
         result = self._execute_command(cmd)
+        self._invalidate_cache(self._context_list_cache_key())
+        # Another context may point at another tenant
+        self.invalidate_apps()
+        self.invalidate_connection()
         
-        logger.info(f"Successfully switched to Qlik context: {name}")
+        logger.info("Successfully switched to Qlik context: %s", name)
         return result
     
-    def context_remove(self, name: str) -> Dict[str, Any]:
+    def context_remove(self, name: str,
+                       contexts_snapshot: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Remove a Qlik context
         
         Args:
             name: Name of the context to remove
+            contexts_snapshot: Result of an earlier context_list() call to check
+                against instead of listing contexts again (for batch callers)
             
         Returns:
             Dictionary containing operation result
@@ -157,30 +315,31 @@ class QlikContextManagementMixin:
         Raises:
             QlikCLIError: If context removal fails or context is currently active
         """
-        logger.info(f"Removing Qlik context: {name}")
+        logger.info("Removing Qlik context: %s", name)
         
         # Validate context name
         if not name or not name.strip():
             raise QlikCLIError("Context name cannot be empty")
         
         # Check if context exists and is not currently active
-        contexts_result = self.context_list()
+        contexts_result = contexts_snapshot or self.context_list()
         current_context = contexts_result['current_context']
         
         if current_context == name:
             raise QlikCLIError(f"Cannot remove currently active context '{name}'. Switch to another context first.")
         
-        available_contexts = [ctx['name'] for ctx in contexts_result['contexts']]
-        if name not in available_contexts:
-            raise QlikCLIError(f"Context '{name}' not found. Available contexts: {', '.join(available_contexts)}")
+        contexts_by_name = self._get_context_index(contexts_result)
+        if name not in contexts_by_name:
+            raise QlikCLIError(f"Context '{name}' not found. Available contexts: {', '.join(contexts_by_name)}")
         
         # Build command
         cmd = [self.cli_path, 'context', 'rm', name]
         
         # Execute command
         result = self._execute_command(cmd)
+        self._invalidate_cache(self._context_list_cache_key())
         
-        logger.info(f"Successfully removed Qlik context: {name}")
+        logger.info("Successfully removed Qlik context: %s", name)
         return result
     
     def context_current(self) -> Dict[str, Any]:
@@ -207,14 +366,31 @@ class QlikContextManagementMixin:
             }
         
         # Find current context details
-        current_context_details = None
-        for ctx in contexts_result['contexts']:
-            if ctx['name'] == current_context:
-                current_context_details = ctx
-                break
+        current_context_details = self._get_context_index(contexts_result).get(current_context)
         
         return {
             'success': True,
             'current_context': current_context,
             'context_details': current_context_details
-        }
\ No newline at end of file
+        }
+    
+    def _get_context_index(self, contexts_result: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the contexts of a context_list result keyed by name, reusing the
+        index while the (cached) result is unchanged
+        
+        Args:
+            contexts_result: Result of context_list()
+            
+        Returns:
+            Dictionary mapping context names to their entries, in listing order
+        """
+        index = self._context_index
+        if index is None or index[0] is not contexts_result:
+            # First entry wins, like the linear search it replaces
+            by_name: Dict[str, Dict[str, Any]] = {}
+            for ctx in contexts_result['contexts']:
+                by_name.setdefault(ctx['name'], ctx)
+            index = (contexts_result, by_name)
+            self._context_index = index
+        return index[1]
@@ -4,24 +4,96 @@ Qlik Space Management Tools
 This module provides methods for space management operations.
 """
 
+import asyncio
 import logging
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import Dict, List, Optional, Any, Tuple
 
-from .qlik_cli_base import QlikCLI, QlikCLIError
+from .qlik_cli_base import QlikCLI, QlikCLIError, _decode_output
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Fields copied as-is from qlik space ls records, with their defaults
+# (meta and links get fresh dictionaries when missing)
+_SPACE_FIELD_DEFAULTS = {
+    'id': '',
+    'name': '',
+    'description': '',
+    'type': '',
+    'createdDate': '',
+    'modifiedDate': '',
+    'tenantId': '',
+    'meta': None,
+    'links': None
+}
+_get_space_fields = itemgetter(*_SPACE_FIELD_DEFAULTS)
+
+
+def _space_fields(space_data: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Extract the _SPACE_FIELD_DEFAULTS fields of a space record in one itemgetter call"""
+    try:
+        return _get_space_fields(space_data)
+    except KeyError:
+        return _get_space_fields({**_SPACE_FIELD_DEFAULTS, 'meta': {}, 'links': {}, **space_data})
+
 
 class QlikSpaceManagementMixin:
     """Mixin class for space management operations"""
     
-    def space_list(self, type_filter: Optional[str] = None) -> Dict[str, Any]:
+    def space_list(self, type_filter: Optional[str] = None, include_raw: bool = False) -> Dict[str, Any]:
         """
         List available Qlik spaces
         
         Args:
             type_filter: Filter by space type (personal, shared, managed)
+            include_raw: Also return the unparsed qlik-cli output as raw_output
+            
+        Returns:
+            Dictionary containing list of spaces
+            
+        Raises:
+            QlikCLIError: If listing spaces fails
+        """
+        logger.info("Listing Qlik spaces with type filter: %s", type_filter)
+        
+        cmd = self._build_space_list_command(type_filter)
+        
+        # Execute command
+        result = self._execute_command(cmd, binary_output=True)
+        
+        # Parse JSON output
+        try:
+            spaces = self._parse_space_list_output(result['stdout'])
+            
+            # Get app count per space (if possible), running the qlik-cli
+            # calls in parallel since each one mostly waits on the process
+            if spaces:
+                max_workers = max(1, min(self.config.qlik.max_parallel_commands, len(spaces)))
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    app_counts = list(executor.map(self._count_space_apps, [space['id'] for space in spaces]))
+                for space, app_count in zip(spaces, app_counts):
+                    space['app_count'] = app_count
+            
+            return self._space_list_response(spaces, type_filter, result, include_raw)
+            
+        except Exception as e:
+            error_msg = f"Failed to process space list output: {str(e)}"
+            logger.error(error_msg)
+            raise QlikCLIError(error_msg)
+    
+    async def space_list_async(self, type_filter: Optional[str] = None,
+                               include_raw: bool = False) -> Dict[str, Any]:
+        """
+        List available Qlik spaces without blocking the event loop
+        
+        The per-space app counts are fetched concurrently (at most
+        max_parallel_commands at a time) instead of one qlik-cli call after another.
+        
+        Args:
+            type_filter: Filter by space type (personal, shared, managed)
+            include_raw: Also return the unparsed qlik-cli output as raw_output
             
         Returns:
             Dictionary containing list of spaces
@@ -29,8 +101,69 @@ class QlikSpaceManagementMixin:
         Raises:
             QlikCLIError: If listing spaces fails
         """
-        logger.info(f"Listing Qlik spaces with type filter: {type_filter}")
+        logger.info("Listing Qlik spaces (async) with type filter: %s", type_filter)
         
+        cmd = self._build_space_list_command(type_filter)
+        result = await self._execute_command_async(cmd, binary_output=True)
+        
+        try:
+            spaces = self._parse_space_list_output(result['stdout'])
+            
+            # Get app count per space (if possible), concurrently but bounded
+            semaphore = asyncio.Semaphore(max(1, self.config.qlik.max_parallel_commands))
+            
+            async def list_space_apps(space_id: str) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self.app_list_async(space_id=space_id, limit=1000)
+            
+            space_apps_results = await asyncio.gather(
+                *[list_space_apps(space['id']) for space in spaces],
+                return_exceptions=True
+            )
+            for space, space_apps in zip(spaces, space_apps_results):
+                if isinstance(space_apps, Exception):
+                    # If we can't get app count, set to unknown
+                    space['app_count'] = -1
+                else:
+                    space['app_count'] = len(space_apps['apps'])
+            
+            return self._space_list_response(spaces, type_filter, result, include_raw)
+            
+        except Exception as e:
+            error_msg = f"Failed to process space list output: {str(e)}"
+            logger.error(error_msg)
+            raise QlikCLIError(error_msg)
+    
+    def _count_space_apps(self, space_id: str) -> int:
+        """
+        Count the apps in a space
+        
+        Args:
+            space_id: Space ID to count apps for
+            
+        Returns:
+            Number of apps in the space, -1 if it cannot be determined
+        """
+        try:
+            space_apps = self.app_list(space_id=space_id, limit=1000)
+            return len(space_apps['apps'])
+        except Exception:
+            # If we can't get app count, set to unknown
+            return -1
+    
+    def _build_space_list_command(self, type_filter: Optional[str]) -> List[str]:
+        """
+        Build the qlik space ls command
+        
+        Args:
+            type_filter: Filter by space type (personal, shared, managed)
+            
+        Returns:
+            List of command components
+            
+        Raises:
+            QlikCLIError: If the type filter is invalid
+        """
         # Build command
         cmd = self._build_base_command()
         cmd.extend(['space', 'ls', '--json'])
@@ -42,54 +175,59 @@ class QlikSpaceManagementMixin:
                 raise QlikCLIError(f"Invalid space type filter: {type_filter}. Valid types: {', '.join(valid_types)}")
             cmd.extend(['--type', type_filter.lower()])
         
-        # Execute command
-        result = self._execute_command(cmd)
+        return cmd
+    
+    def _parse_space_list_output(self, output: str) -> List[Dict[str, Any]]:
+        """
+        Parse qlik space ls output into structured space information
         
-        # Parse JSON output
-        try:
-            spaces_data = self._parse_json_output(result['stdout'])
-            
-            # Process and structure space information
-            spaces = []
-            for space_data in spaces_data:
-                space_info = {
-                    'id': space_data.get('id', ''),
-                    'name': space_data.get('name', ''),
-                    'description': space_data.get('description', ''),
-                    'type': space_data.get('type', ''),
-                    'owner': {
-                        'id': space_data.get('owner', {}).get('id', '') if space_data.get('owner') else '',
-                        'name': space_data.get('owner', {}).get('name', '') if space_data.get('owner') else ''
-                    },
-                    'created_date': space_data.get('createdDate', ''),
-                    'modified_date': space_data.get('modifiedDate', ''),
-                    'tenant_id': space_data.get('tenantId', ''),
-                    'meta': space_data.get('meta', {}),
-                    'links': space_data.get('links', {})
-                }
-                spaces.append(space_info)
-            
-            # Get app count per space (if possible)
-            for space in spaces:
-                try:
-                    # Try to get app count for this space
-                    space_apps = self.app_list(space_id=space['id'], limit=1000)
-                    space['app_count'] = len(space_apps['apps'])
-                except Exception:
-                    # If we can't get app count, set to unknown
-                    space['app_count'] = -1
-            
-            logger.info(f"Successfully listed {len(spaces)} Qlik spaces")
+        Args:
+            output: Raw JSON output of qlik space ls
             
-            return {
-                'success': True,
-                'spaces': spaces,
-                'total_count': len(spaces),
-                'type_filter': type_filter,
-                'raw_output': result['stdout']
+        Returns:
+            List of space dictionaries (without app counts)
+        """
+        spaces_data = self._parse_json_output(output)
+        
+        # Process and structure space information
+        spaces = []
+        for space_data in spaces_data:
+            (space_id, name, description, space_type, created_date, modified_date,
+             tenant_id, meta, links) = _space_fields(space_data)
+            owner_data = space_data.get('owner') or {}
+            space_info = {
+                'id': space_id,
+                'name': name,
+                'description': description,
+                'type': space_type,
+                'owner': {
+                    'id': owner_data.get('id', ''),
+                    'name': owner_data.get('name', '')
+                },
+                'created_date': created_date,
+                'modified_date': modified_date,
+                'tenant_id': tenant_id,
+                'meta': meta,
+                'links': links
             }
-            
-        except Exception as e:
-            error_msg = f"Failed to process space list output: {str(e)}"
-            logger.error(error_msg)
-            raise QlikCLIError(error_msg)
\ No newline at end of file
+            spaces.append(space_info)
+        
+        return spaces
+    
+    def _space_list_response(self,
+                             spaces: List[Dict[str, Any]],
+                             type_filter: Optional[str],
+                             result: Dict[str, Any],
+                             include_raw: bool) -> Dict[str, Any]:
+        """Build the space_list result dictionary"""
+        logger.info("Successfully listed %s Qlik spaces", len(spaces))
+        
+        response = {
+            'success': True,
+            'spaces': spaces,
+            'total_count': len(spaces),
+            'type_filter': type_filter
+        }
+        if include_raw:
+            response['raw_output'] = _decode_output(result['stdout'])
+        return response